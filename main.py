@@ -5,8 +5,14 @@ import os
 # Add src to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # Batch subcommands (python main.py report ...) skip the interactive imports entirely
+    from cli import main as cli_main
+    sys.exit(cli_main())
+
 from finance_tracker import PersonalFinanceTracker
 from visualizer import FinanceVisualizer
+from browser import TransactionBrowser
 from demo import run_full_demo, create_sample_data
 
 from datetime import datetime
@@ -19,10 +25,11 @@ def main():
     print("1. Run Full Demonstration")
     print("2. Interactive Mode")
     print("3. Quick Start with Sample Data")
-    print("4. Exit")
+    print("4. Start Local API Server")
+    print("5. Exit")
 
     while True:
-        match input("\nEnter your choice (1-4): ").strip():
+        match input("\nEnter your choice (1-5): ").strip():
             case "1":
                 print("\n" + "=" * 50)
                 print("RUNNING FULL DEMONSTRATION")
@@ -35,6 +42,11 @@ def main():
                 tracker = create_sample_data()
                 run_with_sample_data(tracker)
             case "4":
+                port = input("Port [8000]: ").strip() or "8000"
+                sample = input("Load sample data? (y/n) [n]: ").strip().lower() == 'y'
+                from api_server import run_server
+                run_server(create_sample_data() if sample else None, port=int(port))
+            case "5":
                 print("Goodbye!")
                 sys.exit(0)
             case _:
@@ -55,9 +67,13 @@ def run_interactive_mode():
         print("4. Set Budget")
         print("5. Check Budget Alerts")
         print("6. Export Data")
-        print("7. Back to Main Menu")
+        print("7. Search Transactions")
+        print("8. Currency Settings")
+        print("9. Browse Transactions")
+        print("10. Open On-Disk Ledger")
+        print("11. Back to Main Menu")
 
-        match input("\nEnter your choice (1-7): ").strip():
+        match input("\nEnter your choice (1-11): ").strip():
             case "1":
                 add_transaction_interactive(tracker)
             case "2":
@@ -71,6 +87,14 @@ def run_interactive_mode():
             case "6":
                 export_data_interactive(tracker)
             case "7":
+                search_transactions_interactive(tracker)
+            case "8":
+                currency_settings_interactive(tracker)
+            case "9":
+                browse_transactions_interactive(tracker)
+            case "10":
+                open_ledger_interactive(tracker)
+            case "11":
                 return
             case _:
                 print("Invalid choice. Please try again.")
@@ -104,8 +128,9 @@ def add_transaction_interactive(tracker):
             print("Please enter a valid number")
 
     payment_method = input("Payment Method [Cash]: ").strip() or "Cash"
+    currency = input(f"Currency [{tracker.base_currency}]: ").strip().upper() or tracker.base_currency
 
-    tracker.add_transaction(date, trans_type, category, description, amount, payment_method)
+    tracker.add_transaction(date, trans_type, category, description, amount, payment_method, currency)
     print("✓ Transaction added successfully!")
 
 def view_reports_interactive(tracker):
@@ -180,7 +205,7 @@ def set_budget_interactive(tracker):
     amount = 0
     while amount <= 0:
         try:
-            amount = float(input(f"Monthly budget for {category}: $").strip())
+            amount = float(input(f"Monthly budget for {category} ({tracker.reporting_currency}): ").strip())
             if amount <= 0:
                 print("Amount must be positive")
         except ValueError:
@@ -206,13 +231,108 @@ def check_budget_alerts_interactive(tracker):
         print(f"\n⚠️ BUDGET ALERTS for {month}/{year}:")
         for alert in alerts:
             print(f"\n  Category: {alert['category']}")
-            print(f"  Budget: ${alert['budget_limit']:.2f}")
-            print(f"  Spent: ${alert['amount_spent']:.2f}")
-            print(f"  Over by: ${alert['over_by']:.2f} ({alert['percentage_over']:.1f}%)")
+            print(f"  Budget: {tracker.format_amount(alert['budget_limit'])}")
+            print(f"  Spent: {tracker.format_amount(alert['amount_spent'])}")
+            print(f"  Over by: {tracker.format_amount(alert['over_by'])} ({alert['percentage_over']:.1f}%)")
     else:
         print(f"\n✓ All categories within budget for {month}/{year}!")
         print("No budgets set. Use 'Set Budget' option to create budgets.")
 
+def search_transactions_interactive(tracker):
+    """Search transactions by description"""
+    print("\n" + "-" * 30)
+    print("SEARCH TRANSACTIONS")
+    print("-" * 30)
+    print("Tip: end a word with * to match prefixes (e.g. netfl*)")
+
+    query = input("Search terms: ").strip()
+    if not query:
+        print("Please enter at least one search term")
+        return
+
+    mode = input("Match all or any terms (all/any) [all]: ").strip().lower()
+    mode = 'or' if mode == 'any' else 'and'
+    start_date = input("From date (YYYY-MM-DD) [any]: ").strip() or None
+    end_date = input("To date (YYYY-MM-DD) [any]: ").strip() or None
+    trans_type = input("Type (income/expense) [any]: ").strip().lower() or None
+    category = input("Category [any]: ").strip() or None
+
+    try:
+        results = tracker.search_transactions(query, mode=mode, start_date=start_date, end_date=end_date,
+                                              trans_type=trans_type, category=category)
+    except Exception as excep:
+        print(f"Error searching transactions: {excep}")
+        return
+
+    if len(results) == 0:
+        print("No matching transactions found")
+    else:
+        print(f"\n✓ {len(results)} matching transactions")
+        browse_transactions_interactive(tracker, results, title="SEARCH RESULTS")
+
+def currency_settings_interactive(tracker):
+    """Load FX rates and choose the reporting currency"""
+    print("\n" + "-" * 30)
+    print("CURRENCY SETTINGS")
+    print("-" * 30)
+    print(f"Base currency: {tracker.base_currency}")
+    print(f"Reporting currency: {tracker.reporting_currency}")
+
+    filename = input("FX rates CSV (date,currency,rate) [skip]: ").strip()
+    if filename:
+        try:
+            tracker.load_fx_rates(filename)
+        except Exception as excep:
+            print(f"Error loading FX rates: {excep}")
+            return
+
+    currency = input(f"Reporting currency [{tracker.reporting_currency}]: ").strip()
+    if currency:
+        try:
+            tracker.set_reporting_currency(currency)
+        except ValueError as excep:
+            print(f"Error: {excep}")
+
+def browse_transactions_interactive(tracker, transactions=None, title="ALL TRANSACTIONS"):
+    """Page through transactions (or a subset such as search results) one screen at a time"""
+    if transactions is None:
+        transactions = tracker.transactions
+    browser = TransactionBrowser(transactions)
+
+    while True:
+        print("\n" + "=" * 50)
+        print(title)
+        print("=" * 50)
+        print(browser.render())
+        print("\n[n]ext  [p]revious  [g]o <page>  [d]ate <YYYY-MM-DD>  "
+              "[f]ilter <type|-> <category|->  [s]ort <column> [asc|desc]  [q]uit")
+
+        command, *args = (input("Browse: ").strip().split() or ["n"])
+        try:
+            match command.lower():
+                case "n" | "next":
+                    browser.next_page()
+                case "p" | "prev" | "previous":
+                    browser.previous_page()
+                case "g" | "go":
+                    browser.go_to_page(int(args[0]) - 1)
+                case "d" | "date":
+                    if not browser.seek_date(args[0]):
+                        print(f"No transactions on or after {args[0]}")
+                case "f" | "filter":
+                    trans_type = args[0].lower() if args and args[0] != "-" else None
+                    category = " ".join(args[1:]) if len(args) > 1 and args[1] != "-" else None
+                    browser.set_filter(trans_type, category)
+                case "s" | "sort":
+                    ascending = not (len(args) > 1 and args[1].lower() == "desc")
+                    browser.sort_by(args[0], ascending)
+                case "q" | "quit":
+                    return
+                case _:
+                    print("Invalid command!")
+        except (IndexError, ValueError, TypeError) as excep:
+            print(f"Invalid command: {excep}")
+
 def export_data_interactive(tracker):
     """Export data to CSV"""
     print("\n" + "-" * 30)
@@ -237,6 +357,22 @@ def export_data_interactive(tracker):
     except Exception as excep:
         print(f"Error exporting data: {excep}")
 
+def open_ledger_interactive(tracker):
+    """Keep transactions in a year/month partitioned ledger directory"""
+    print("\n" + "-" * 30)
+    print("OPEN ON-DISK LEDGER")
+    print("-" * 30)
+
+    if tracker.ledger is not None:
+        print(f"Already attached to {tracker.ledger.directory}")
+        return
+
+    directory = input("Ledger directory [data/ledger]: ").strip() or os.path.join('data', 'ledger')
+    try:
+        tracker.attach_ledger(directory)
+    except Exception as excep:
+        print(f"Error opening ledger: {excep}")
+
 def run_with_sample_data(tracker):
     """Run with preloaded sample data"""
     visualizer = FinanceVisualizer()
@@ -275,10 +411,7 @@ def run_with_sample_data(tracker):
             case "4":
                 add_transaction_interactive(tracker)
             case "5":
-                print("\n" + "=" * 50)
-                print("ALL TRANSACTIONS")
-                print("=" * 50)
-                print(tracker.transactions.to_string())
+                browse_transactions_interactive(tracker)
             case "6":
                 return
             case _:
@@ -0,0 +1,348 @@
+import asyncio
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+try:
+    from .finance_tracker import PersonalFinanceTracker, build_transaction_frame
+    from .visualizer import CHARTS, FinanceVisualizer
+except ImportError:
+    from finance_tracker import PersonalFinanceTracker, build_transaction_frame
+    from visualizer import CHARTS, FinanceVisualizer
+
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def to_jsonable(value):
+    """Convert pandas/numpy results into plain JSON-serializable Python objects"""
+    if isinstance(value, pd.DataFrame):
+        records = value.to_dict(orient='records')
+        return [to_jsonable(record) for record in records]
+    if isinstance(value, pd.Series):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+class FinanceAPIServer:
+    """
+    Asyncio HTTP/JSON service around a PersonalFinanceTracker.
+
+    Reads run on a thread pool against the tracker's current LedgerSnapshot, so they never
+    block the event loop, each other, or writers. Writes are queued and applied in batches
+    by a single writer thread, each batch publishing one new tracker version.
+    """
+
+    def __init__(self, tracker=None, host='127.0.0.1', port=8000, read_workers=4):
+        self.tracker = tracker or PersonalFinanceTracker()
+        self.visualizer = FinanceVisualizer()
+        self.host = host
+        self.port = port
+        self.read_executor = ThreadPoolExecutor(max_workers=read_workers, thread_name_prefix='api-read')
+        self.write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='api-write')
+        self.chart_lock = threading.Lock()
+        self.server = None
+        self._write_queue = None
+        self._writer_task = None
+
+    async def start(self):
+        self._write_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._write_worker())
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+        self.read_executor.shutdown(wait=False)
+        self.write_executor.shutdown(wait=False)
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"✓ Finance API listening on http://{self.host}:{self.port}")
+        async with self.server:
+            await self.server.serve_forever()
+
+    # ---- Writes ---------------------------------------------------------------
+
+    async def _submit_write(self, operation, payload):
+        future = asyncio.get_running_loop().create_future()
+        await self._write_queue.put((operation, payload, future))
+        return await future
+
+    async def _write_worker(self):
+        """Drain every queued write and apply them together in one executor call"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._write_queue.get()]
+            while not self._write_queue.empty():
+                batch.append(self._write_queue.get_nowait())
+
+            try:
+                results = await loop.run_in_executor(self.write_executor, self._apply_writes, batch)
+            except Exception as excep:
+                results = [excep] * len(batch)
+
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _apply_writes(self, batch):
+        """
+        Append every queued transaction in one write, then set the queued budgets. Each operation
+        gets its own result, so a failed append fails only the transaction requests.
+        """
+        results = [None] * len(batch)
+        appends = [position for position, (operation, _, _) in enumerate(batch) if operation == 'transactions']
+        if appends:
+            frames = [batch[position][1] for position in appends]
+            try:
+                self.tracker.add_transactions(pd.concat(frames, ignore_index=True))
+                for position, frame in zip(appends, frames):
+                    results[position] = len(frame)
+            except Exception as excep:
+                for position in appends:
+                    results[position] = excep
+
+        with self.tracker.batch():
+            for position, (operation, payload, _) in enumerate(batch):
+                if operation == 'budget':
+                    try:
+                        self.tracker.set_budget(*payload)
+                        results[position] = payload[1]
+                    except Exception as excep:
+                        results[position] = excep
+        return results
+
+    # ---- HTTP plumbing --------------------------------------------------------
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                try:
+                    method, target, _ = request_line.decode('latin-1').split(' ', 2)
+                except ValueError:
+                    await self._send(writer, HTTPStatus.BAD_REQUEST, {'error': 'Malformed request line'}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = headers.get('content-length', '0') or '0'
+                if not (length.isascii() and length.isdigit()):
+                    await self._send(writer, HTTPStatus.BAD_REQUEST, {'error': 'Invalid Content-Length'}, False)
+                    break
+                length = int(length)
+                if length > MAX_BODY_SIZE:
+                    await self._send(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': 'Body too large'}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+                keep_alive = headers.get('connection', '').lower() != 'close'
+
+                try:
+                    status, payload, content_type = await self._dispatch(method, target, body)
+                except HTTPError as excep:
+                    status, payload, content_type = excep.status, {'error': excep.message}, None
+                except (ValueError, KeyError, TypeError) as excep:
+                    status, payload, content_type = HTTPStatus.BAD_REQUEST, {'error': str(excep)}, None
+                except Exception as excep:
+                    status, payload, content_type = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(excep)}, None
+
+                await self._send(writer, status, payload, keep_alive, content_type)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _send(writer, status, payload, keep_alive, content_type=None):
+        if content_type is None:
+            body = json.dumps(payload).encode('utf-8')
+            content_type = 'application/json'
+        else:
+            body = payload
+
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def _dispatch(self, method, target, body):
+        url = urlsplit(target)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip('/') or '/'
+        route = (method, path)
+
+        if route == ('GET', '/health'):
+            return HTTPStatus.OK, {'status': 'ok', 'transactions': self.tracker.snapshot().row_count}, None
+        if route == ('POST', '/transactions'):
+            record = self._parse_json(body)
+            return await self._add_transactions([record] if isinstance(record, dict) else record)
+        if route == ('POST', '/transactions/bulk'):
+            records = self._parse_json(body)
+            if isinstance(records, dict):
+                records = records.get('transactions', [])
+            return await self._add_transactions(records)
+        if route == ('POST', '/budgets'):
+            data = self._parse_json(body)
+            limit = float(data['limit'])
+            currency = (data.get('currency') or self.tracker.reporting_currency).upper()
+            await self._submit_write('budget', (data['category'], limit, currency))
+            return HTTPStatus.CREATED, {'category': data['category'], 'limit': limit, 'currency': currency}, None
+        if route == ('GET', '/summary'):
+            return await self._read(self._summary, params)
+        if route == ('GET', '/categories'):
+            return await self._read(self._categories, params)
+        if route == ('GET', '/alerts'):
+            return await self._read(self._alerts, params)
+        if route == ('GET', '/search'):
+            return await self._search(params)
+        if method == 'GET' and path.startswith('/charts/'):
+            return await self._read(self._chart, path[len('/charts/'):], params)
+
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {method} {path}")
+
+    @staticmethod
+    def _parse_json(body):
+        try:
+            return json.loads(body or b'null')
+        except json.JSONDecodeError as excep:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {excep}")
+
+    async def _read(self, handler, *args):
+        snapshot = self.tracker.snapshot()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.read_executor, handler, snapshot, *args)
+
+    # ---- Handlers -------------------------------------------------------------
+
+    async def _add_transactions(self, records):
+        if not isinstance(records, list):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Expected a transaction object or a list of them")
+        if len(records) > 1000:
+            frame = await asyncio.get_running_loop().run_in_executor(
+                self.read_executor, build_transaction_frame, records, self.tracker.base_currency)
+        else:
+            frame = build_transaction_frame(records, self.tracker.base_currency)
+        added = await self._submit_write('transactions', frame)
+        return HTTPStatus.CREATED, {'added': added}, None
+
+    async def _search(self, params):
+        if not params.get('q'):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Missing query parameter 'q'")
+        search = {
+            'query': params['q'],
+            'mode': params.get('mode', 'and'),
+            'start_date': params.get('start_date'),
+            'end_date': params.get('end_date'),
+            'trans_type': params.get('type'),
+            'category': params.get('category'),
+        }
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(self.read_executor,
+                                             lambda: self.tracker.search_transactions(**search))
+        return HTTPStatus.OK, {'results': to_jsonable(results)}, None
+
+    @staticmethod
+    def _summary(snapshot, params):
+        summary = snapshot.get_financial_summary(params.get('start_date'), params.get('end_date'))
+        return HTTPStatus.OK, {'summary': to_jsonable(summary), 'currency': snapshot.reporting_currency}, None
+
+    @staticmethod
+    def _categories(snapshot, params):
+        analysis = snapshot.get_category_analysis(params.get('start_date'), params.get('end_date'))
+        return HTTPStatus.OK, {'categories': to_jsonable(analysis), 'currency': snapshot.reporting_currency}, None
+
+    @staticmethod
+    def _alerts(snapshot, params):
+        month = int(params['month']) if 'month' in params else None
+        year = int(params['year']) if 'year' in params else None
+        alerts = snapshot.check_budget_alerts(month, year)
+        return HTTPStatus.OK, {'alerts': to_jsonable(alerts), 'currency': snapshot.reporting_currency}, None
+
+    def _chart(self, snapshot, name, params):
+        if name not in CHARTS:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown chart '{name}'")
+        method_name, allowed = CHARTS[name]
+        kwargs = {key: convert(params[key]) for key, convert in allowed.items() if key in params}
+
+        # pyplot keeps global state, so render one chart at a time
+        with self.chart_lock:
+            fig = getattr(self.visualizer, method_name)(snapshot, show=False, **kwargs)
+            if fig is None:
+                raise HTTPError(HTTPStatus.NOT_FOUND, "No data to visualize")
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png')
+            plt.close(fig)
+        return HTTPStatus.OK, buffer.getvalue(), 'image/png'
+
+
+def run_server(tracker=None, host='127.0.0.1', port=8000):
+    """Serve the tracker over HTTP until interrupted"""
+    plt.switch_backend('Agg')
+    server = FinanceAPIServer(tracker, host=host, port=port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nAPI server stopped")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the finance tracker as a local HTTP/JSON API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--sample-data', action='store_true', help="Preload the sample ledger")
+    args = parser.parse_args()
+
+    if args.sample_data:
+        from demo import create_sample_data
+        run_server(create_sample_data(), args.host, args.port)
+    else:
+        run_server(host=args.host, port=args.port)
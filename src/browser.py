@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+
+class TransactionBrowser:
+    """
+    Paged view over a transactions frame. Filters and sorting only reorder an array of
+    row positions; formatting touches nothing but the rows on the current page.
+    """
+
+    def __init__(self, transactions, page_size=20):
+        if page_size < 1:
+            raise ValueError("Page size must be at least 1")
+        self.transactions = transactions
+        self.page_size = page_size
+        self.page = 0
+        self.trans_type = None
+        self.category = None
+        self.sort_column = None
+        self.ascending = True
+        self.rows = np.arange(len(transactions))
+
+    @property
+    def page_count(self):
+        return max(1, -(-len(self.rows) // self.page_size))
+
+    def _refresh(self):
+        mask = np.ones(len(self.transactions), dtype=bool)
+        if self.trans_type is not None:
+            mask &= (self.transactions['type'] == self.trans_type).to_numpy()
+        if self.category is not None:
+            categories = self.transactions['category'].str.lower() == self.category.lower()
+            mask &= categories.to_numpy(dtype=bool, na_value=False)
+        rows = np.flatnonzero(mask)
+
+        if self.sort_column is not None:
+            # pandas keeps tied rows in ledger order both ways and puts missing values last
+            values = self.transactions[self.sort_column].iloc[rows].reset_index(drop=True)
+            order = values.sort_values(ascending=self.ascending, kind='stable', na_position='last').index
+            rows = rows[order.to_numpy()]
+
+        self.rows = rows
+        self.page = min(self.page, self.page_count - 1)
+
+    def set_filter(self, trans_type=None, category=None):
+        """Show only rows of the given type and/or category (None clears that filter)"""
+        if trans_type not in [None, 'income', 'expense']:
+            raise ValueError("Transaction type must be 'income' or 'expense'")
+        self.trans_type = trans_type
+        self.category = category
+        self.page = 0
+        self._refresh()
+
+    def sort_by(self, column, ascending=True):
+        if column not in self.transactions:
+            raise ValueError(f"Unknown column: {column}")
+        self.sort_column = column
+        self.ascending = ascending
+        self.page = 0
+        self._refresh()
+
+    def go_to_page(self, page):
+        self.page = min(max(page, 0), self.page_count - 1)
+
+    def next_page(self):
+        self.go_to_page(self.page + 1)
+
+    def previous_page(self):
+        self.go_to_page(self.page - 1)
+
+    def seek_date(self, date):
+        """
+        Jump to the page where the date is reached in the current order: the first row on or
+        after it (or on or before it when sorted by date descending). Returns False if none.
+        """
+        date = pd.to_datetime(date)
+        dates = self.transactions['date'].to_numpy()[self.rows]
+        if self.sort_column == 'date':
+            if self.ascending:
+                position = np.searchsorted(dates, np.datetime64(date), side='left')
+            else:
+                position = len(dates) - np.searchsorted(dates[::-1], np.datetime64(date), side='right')
+        else:
+            matches = np.flatnonzero(dates >= np.datetime64(date))
+            position = matches[0] if len(matches) else len(dates)
+
+        if position < 0 or position >= len(dates):
+            return False
+        self.go_to_page(int(position) // self.page_size)
+        return True
+
+    def current_page(self):
+        """The rows on the current page as a DataFrame"""
+        start = self.page * self.page_size
+        return self.transactions.iloc[self.rows[start:start + self.page_size]]
+
+    def render(self):
+        """Format only the current page for display"""
+        page = self.current_page()
+        if len(page) == 0:
+            return "No transactions to show"
+
+        filters = []
+        if self.trans_type:
+            filters.append(f"type={self.trans_type}")
+        if self.category:
+            filters.append(f"category={self.category}")
+        if self.sort_column:
+            filters.append(f"sorted by {self.sort_column} {'asc' if self.ascending else 'desc'}")
+
+        header = f"Page {self.page + 1}/{self.page_count} ({len(self.rows)} transactions)"
+        if filters:
+            header += " - " + ", ".join(filters)
+        return header + "\n" + page.to_string()
@@ -0,0 +1,329 @@
+import re
+from bisect import bisect_left
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+def fold_pattern(pattern):
+    """
+    Case-fold a regex so it matches lowercased text without re.IGNORECASE, which defeats the
+    regex engine's fast path on large alternations. Only literal text is lowercased; escaped
+    characters are kept. Returns None when the pattern uses syntax that lowercasing or joining
+    it with other patterns would change: character classes, groups other than (?:...),
+    backreferences, inline flags and escapes naming a character by code or name.
+    """
+    folded = []
+    escaped = False
+    for position, char in enumerate(pattern):
+        if escaped:
+            if char.isdigit() or char in 'xuUN':
+                return None
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '[' or (char == '(' and not pattern.startswith('?:', position + 1)):
+            return None
+        else:
+            char = char.lower()
+        folded.append(char)
+    return ''.join(folded)
+
+
+def _at_word_boundary(text, index):
+    """Same test as the regex \\b: a word character on exactly one side of index"""
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == '_')
+    after = index < len(text) and (text[index].isalnum() or text[index] == '_')
+    return before != after
+
+
+class LiteralAutomaton:
+    """
+    Aho-Corasick automaton over the literal strings of keyword and merchant rules. One pass
+    over a description finds every literal occurring in it, whatever the number of rules.
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [()]
+
+    def add(self, literal, rule_index, whole_word):
+        node = 0
+        for char in literal:
+            child = self.goto[node].get(char)
+            if child is None:
+                child = len(self.goto)
+                self.goto[node][char] = child
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append(())
+            node = child
+        self.outputs[node] += ((rule_index, len(literal), whole_word),)
+
+    def finalize(self):
+        """Compute failure links breadth-first, merging each node's outputs with its fallback's"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.outputs[child] += self.outputs[self.fail[child]]
+        return self
+
+    def first_rule(self, text, start=0):
+        """Lowest rule index >= start with a literal in text (whole words where required), or -1"""
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        node = 0
+        best = -1
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for rule_index, length, whole_word in outputs[node]:
+                if rule_index < start or 0 <= best <= rule_index:
+                    continue
+                if whole_word and not (_at_word_boundary(text, position + 1 - length)
+                                       and _at_word_boundary(text, position + 1)):
+                    continue
+                best = rule_index
+                if best == start:
+                    return best
+        return best
+
+
+class CategoryRule:
+    """
+    A single categorization rule: a description pattern plus optional type/amount conditions.
+    Rules whose pattern is just "any of these strings" also carry them as literals (whole words
+    or not), which lets the categorizer match them with its literal automaton. Patterns that
+    can't be case-folded (see fold_pattern) get a case-insensitive matcher of their own.
+    """
+
+    def __init__(self, name, category, pattern, trans_type=None, min_amount=None, max_amount=None,
+                 literals=None, whole_words=False):
+        if trans_type not in [None, 'income', 'expense']:
+            raise ValueError("Transaction type must be 'income' or 'expense'")
+        re.compile(pattern)
+
+        self.name = name
+        self.category = category
+        self.pattern = pattern
+        self.folded_pattern = fold_pattern(pattern)
+        self.search = None
+        if self.folded_pattern is not None:
+            re.compile(self.folded_pattern)
+        else:
+            self.search = re.compile(pattern, re.IGNORECASE | re.DOTALL).search
+        self.literals = [literal.lower() for literal in literals] if literals and all(literals) else None
+        self.whole_words = whole_words
+        self.trans_type = trans_type
+        self.min_amount = min_amount
+        self.max_amount = max_amount
+
+    def has_conditions(self):
+        return self.trans_type is not None or self.min_amount is not None or self.max_amount is not None
+
+    def accepts(self, amounts, types):
+        """Vectorized check of the type/amount conditions for rows whose description matched"""
+        mask = np.ones(len(amounts), dtype=bool)
+        if self.trans_type is not None and types is not None:
+            mask &= types == self.trans_type
+        if self.min_amount is not None and amounts is not None:
+            mask &= amounts >= self.min_amount
+        if self.max_amount is not None and amounts is not None:
+            mask &= amounts <= self.max_amount
+        return mask
+
+
+class TransactionCategorizer:
+    """
+    Assigns categories to transactions from an ordered list of rules.
+    The first rule whose pattern and conditions match a row wins.
+    """
+
+    def __init__(self):
+        self.rules = []
+        self.rule_hits = {}
+        self.unmatched = 0
+        self._matchers = {}
+        self._automaton = None
+        self._regex_rules = None
+        self._separate_rules = None
+
+    def add_rule(self, rule):
+        if rule.name in self.rule_hits:
+            raise ValueError(f"A rule named '{rule.name}' already exists")
+        self.rules.append(rule)
+        self.rule_hits[rule.name] = 0
+        self._matchers = {}
+        self._automaton = None
+        self._regex_rules = None
+        self._separate_rules = None
+        return rule
+
+    def add_keyword_rule(self, category, keywords, name=None, **conditions):
+        """Match descriptions containing any of the given whole words"""
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        pattern = r'\b(?:' + '|'.join(re.escape(keyword) for keyword in keywords) + r')\b'
+        name = name or f"keyword:{'|'.join(keywords)}"
+        return self.add_rule(CategoryRule(name, category, pattern, literals=keywords, whole_words=True,
+                                          **conditions))
+
+    def add_regex_rule(self, category, pattern, name=None, **conditions):
+        """
+        Match descriptions against a regular expression. Patterns without character classes,
+        capturing groups, backreferences or inline flags are matched fastest.
+        """
+        name = name or f"regex:{pattern}"
+        return self.add_rule(CategoryRule(name, category, pattern, **conditions))
+
+    def add_merchant(self, merchant, aliases, category, **conditions):
+        """Match any of the raw strings a bank uses for one merchant (e.g. 'AMZN MKTP', 'AMAZON.COM')"""
+        if isinstance(aliases, str):
+            aliases = [aliases]
+        pattern = '(?:' + '|'.join(re.escape(alias) for alias in [merchant, *aliases]) + ')'
+        return self.add_rule(CategoryRule(f"merchant:{merchant}", category, pattern,
+                                          literals=[merchant, *aliases], **conditions))
+
+    def _literal_automaton(self):
+        if self._automaton is None:
+            automaton = LiteralAutomaton()
+            for index, rule in enumerate(self.rules):
+                for literal in rule.literals or []:
+                    automaton.add(literal, index, rule.whole_words)
+            self._automaton = automaton.finalize()
+        return self._automaton
+
+    def _regex_rule_indices(self):
+        """Indices of the rules matched by the combined regex (no literals, foldable), in rule order"""
+        if self._regex_rules is None:
+            self._regex_rules = [index for index, rule in enumerate(self.rules)
+                                 if rule.literals is None and rule.search is None]
+        return self._regex_rules
+
+    def _separate_rule_indices(self):
+        """Indices of the rules with a matcher of their own, in rule order"""
+        if self._separate_rules is None:
+            self._separate_rules = [index for index, rule in enumerate(self.rules)
+                                    if rule.literals is None and rule.search is not None]
+        return self._separate_rules
+
+    def _matcher(self, low, high):
+        """
+        Compile the regex rules at positions [low, high) of _regex_rule_indices() into one plain
+        alternation of their case-folded patterns, for matching lowercased descriptions. Named
+        groups would disable the regex engine's fast path for literal alternatives, so the
+        matcher only answers whether any rule in the range matches.
+        """
+        key = (low, high)
+        if key not in self._matchers:
+            rules = [self.rules[index] for index in self._regex_rule_indices()[low:high]]
+            pattern = '|'.join(f'(?:{rule.folded_pattern})' for rule in rules)
+            self._matchers[key] = re.compile(pattern, re.DOTALL).search
+        return self._matchers[key]
+
+    def _match_descriptions(self, descriptions, start):
+        """
+        Index of the first matching rule at or after start for each lowercased description
+        (-1 for none). Keyword and merchant rules are found in one automaton pass. Regex rules
+        take one scan with their combined matcher, then only when that scan hits and a regex
+        rule could still win, a bisection of the regex rules (log2(regex rules) more scans).
+        Rules with their own matcher are tried last, and only while they could still win.
+        """
+        automaton = self._literal_automaton()
+        regex_rules = self._regex_rule_indices()
+        separate_rules = self._separate_rule_indices()
+        separate_rules = separate_rules[bisect_left(separate_rules, start):]
+        first = bisect_left(regex_rules, start)
+        matches_any = self._matcher(first, len(regex_rules)) if first < len(regex_rules) else None
+
+        matched = np.full(len(descriptions), -1, dtype=np.int64)
+        for position, description in enumerate(descriptions):
+            best = automaton.first_rule(description, start)
+            if matches_any is not None and (best < 0 or regex_rules[first] < best) \
+                    and matches_any(description) is not None:
+                low, high = first, len(regex_rules)
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._matcher(low, middle)(description) is not None:
+                        high = middle
+                    else:
+                        low = middle
+                if best < 0 or regex_rules[low] < best:
+                    best = regex_rules[low]
+            for index in separate_rules:
+                if 0 <= best < index:
+                    break
+                if self.rules[index].search(description) is not None:
+                    best = index
+                    break
+            matched[position] = best
+        return matched
+
+    def categorize(self, transactions):
+        """Return a Series of categories aligned with transactions (None where no rule matched)"""
+        count = len(transactions)
+        categories = np.full(count, None, dtype=object)
+        if count == 0 or not self.rules:
+            self.unmatched += count
+            return pd.Series(categories, index=transactions.index, dtype=object)
+
+        # Bank exports repeat the same descriptions constantly, so match each distinct one once
+        codes, uniques = pd.factorize(transactions['description'].fillna('').astype(str).str.lower())
+        uniques = np.asarray(uniques, dtype=object)
+        amounts = transactions['amount'].to_numpy(dtype=float) if 'amount' in transactions else None
+        types = transactions['type'].to_numpy(dtype=object) if 'type' in transactions else None
+
+        next_rule = np.zeros(count, dtype=np.int64)
+        pending = np.arange(count)
+        while len(pending):
+            matched = np.empty(len(pending), dtype=np.int64)
+            for start in np.unique(next_rule[pending]):
+                selected = next_rule[pending] == start
+                unique_codes, inverse = np.unique(codes[pending[selected]], return_inverse=True)
+                matched[selected] = self._match_descriptions(uniques[unique_codes], start)[inverse]
+
+            self.unmatched += int(np.count_nonzero(matched < 0))
+            retry = []
+            for rule_index in np.unique(matched[matched >= 0]):
+                rule = self.rules[rule_index]
+                rows = pending[matched == rule_index]
+                if rule.has_conditions():
+                    accepted = rule.accepts(None if amounts is None else amounts[rows],
+                                            None if types is None else types[rows])
+                else:
+                    accepted = np.ones(len(rows), dtype=bool)
+
+                categories[rows[accepted]] = rule.category
+                self.rule_hits[rule.name] += int(np.count_nonzero(accepted))
+
+                # Rows failing the conditions fall through to the following rules
+                rejected = rows[~accepted]
+                if len(rejected):
+                    if rule_index + 1 < len(self.rules):
+                        next_rule[rejected] = rule_index + 1
+                        retry.append(rejected)
+                    else:
+                        self.unmatched += len(rejected)
+
+            pending = np.concatenate(retry) if retry else np.empty(0, dtype=np.int64)
+
+        return pd.Series(categories, index=transactions.index, dtype=object)
+
+    def get_statistics(self):
+        """Per-rule hit counts (in rule order) and the number of rows no rule matched"""
+        return {
+            'rule_hits': {rule.name: self.rule_hits[rule.name] for rule in self.rules},
+            'unmatched': self.unmatched
+        }
+
+    def reset_statistics(self):
+        self.rule_hits = {rule.name: 0 for rule in self.rules}
+        self.unmatched = 0
@@ -0,0 +1,312 @@
+import argparse
+import contextlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Only the standard library is imported up front; pandas and the tracker load when a command
+# runs, and matplotlib only for `chart`, so cron jobs pay for nothing they don't use.
+
+FORMATS = ['csv', 'json', 'jsonl']
+CHUNK_ROWS = 10000
+ALERTS_EXIT_CODE = 3
+
+
+def _core():
+    try:
+        from . import finance_tracker, utils
+    except ImportError:
+        import finance_tracker
+        import utils
+    return finance_tracker, utils
+
+
+# ---- Input ----------------------------------------------------------------
+
+def read_inputs(paths, jobs=1):
+    """Read transaction CSVs in order ('-' is stdin), parsing up to `jobs` files at a time"""
+    _, utils = _core()
+
+    def read(path):
+        return utils.read_transactions_csv(sys.stdin if path == '-' else path)
+
+    if jobs > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix='cli-read') as executor:
+            return list(executor.map(read, paths))
+    return [read(path) for path in paths]
+
+
+def parse_budget(text):
+    category, separator, limit = text.rpartition('=')
+    if not separator or not category:
+        raise argparse.ArgumentTypeError(f"Budget must look like CATEGORY=LIMIT, got '{text}'")
+    try:
+        return category, float(limit)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Budget limit must be a number, got '{limit}'")
+
+
+def build_tracker(args):
+    """Tracker over the ledger directory, or over the input files (stdin when neither is given)"""
+    finance_tracker, utils = _core()
+    tracker = finance_tracker.PersonalFinanceTracker()
+    for filename in args.fx_rates:
+        tracker.load_fx_rates(filename)
+
+    if args.ledger:
+        tracker.attach_ledger(args.ledger)
+    else:
+        frames = read_inputs(args.input or ['-'], args.jobs)
+        with tracker.batch():
+            for frame in frames:
+                utils.import_transactions(tracker, frame, duplicates=args.duplicates)
+
+    if args.currency:
+        tracker.set_reporting_currency(args.currency)
+    budgets = list(args.budget)
+    if args.budgets:
+        import pandas as pd
+        budget_table = pd.read_csv(args.budgets)
+        budgets += zip(budget_table['category'], budget_table['limit'])
+    with tracker.batch():
+        for category, limit in budgets:
+            tracker.set_budget(category, float(limit))
+    return tracker
+
+
+def period_range(args):
+    """(start, end) from --start/--end, else the --month/--year month (default: this month)"""
+    import pandas as pd
+
+    if args.start or args.end:
+        return (pd.Timestamp(args.start) if args.start else None,
+                pd.Timestamp(args.end) if args.end else None)
+    today = pd.Timestamp.now()
+    start = pd.Timestamp(year=args.year or today.year, month=args.month or today.month, day=1)
+    return start, start + pd.offsets.MonthEnd(0)
+
+
+# ---- Output ---------------------------------------------------------------
+
+def write_frames(frames, fmt, out):
+    """Stream DataFrames as CSV (one header), a single JSON array, or JSON lines, chunk by chunk"""
+    first = True
+    for frame in frames:
+        for start in range(0, max(len(frame), 1), CHUNK_ROWS):
+            chunk = frame.iloc[start:start + CHUNK_ROWS]
+            if fmt == 'csv':
+                if len(chunk) or first:
+                    chunk.to_csv(out, header=first, index=False, lineterminator='\n')
+                    first = False
+                continue
+            if len(chunk) == 0:
+                continue
+            if fmt == 'jsonl':
+                out.write(chunk.to_json(orient='records', lines=True, date_format='iso').rstrip('\n') + '\n')
+            else:
+                out.write(('[' if first else ',\n') + chunk.to_json(orient='records', date_format='iso')[1:-1])
+            first = False
+    if fmt == 'json':
+        out.write('[]\n' if first else ']\n')
+
+
+def write_records(records, fmt, out):
+    import pandas as pd
+    write_frames([pd.DataFrame(records)], fmt, out)
+
+
+def iter_transactions(snapshot, start=None, end=None):
+    """Yield a snapshot's transactions in the date range, one ledger partition at a time"""
+    if snapshot.partitions is None:
+        transactions = snapshot.transactions
+        if start is not None:
+            transactions = transactions[transactions['date'] >= start]
+        if end is not None:
+            transactions = transactions[transactions['date'] <= end]
+        yield transactions
+        return
+
+    for key in snapshot.ledger.overlapping(snapshot.partitions, start, end):
+        rows = snapshot.ledger.load(start, end, partitions={key: snapshot.partitions[key]})
+        if rows is not None:
+            yield rows
+
+
+# ---- Commands -------------------------------------------------------------
+
+def command_import(args, out):
+    finance_tracker, utils = _core()
+    tracker = finance_tracker.PersonalFinanceTracker()
+    tracker.attach_ledger(args.ledger)
+    paths = args.files or ['-']
+    frames = read_inputs(paths, args.jobs)
+
+    records = []
+    with tracker.batch():
+        for path, frame in zip(paths, frames):
+            added = utils.import_transactions(tracker, frame, duplicates=args.duplicates)
+            records.append({'file': path, 'rows': len(frame), 'added': added})
+    tracker.save_warm_cache()
+    write_records(records, args.format, out)
+    return 0
+
+
+def command_report(args, out):
+    snapshot = build_tracker(args).snapshot()
+    start, end = period_range(args)
+    if args.by_category:
+        analysis = snapshot.get_category_analysis(start, end) or {}
+        records = [{'type': trans_type, 'category': category, 'amount': amount}
+                   for trans_type, key in [('income', 'income_by_category'), ('expense', 'expense_by_category')]
+                   for category, amount in analysis.get(key, {}).items()]
+    else:
+        summary = snapshot.get_financial_summary(start, end)
+        records = [{'start': start, 'end': end, **summary}] if summary else []
+    for record in records:
+        record['currency'] = snapshot.reporting_currency
+    write_records(records, args.format, out)
+    return 0
+
+
+def command_alerts(args, out):
+    snapshot = build_tracker(args).snapshot()
+    start, _ = period_range(args)
+    alerts = snapshot.check_budget_alerts(start.month, start.year)
+    for alert in alerts:
+        alert.update({'month': start.month, 'year': start.year, 'currency': snapshot.reporting_currency})
+    write_records(alerts, args.format, out)
+    return ALERTS_EXIT_CODE if alerts and args.fail_on_alert else 0
+
+
+def command_chart(args, out):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    try:
+        from .visualizer import CHARTS, FinanceVisualizer
+    except ImportError:
+        from visualizer import CHARTS, FinanceVisualizer
+
+    unknown = [name for name in args.names if name not in CHARTS]
+    if unknown:
+        raise ValueError(f"Unknown chart: {', '.join(unknown)} (choose from {', '.join(CHARTS)})")
+    if args.output and len(args.names) > 1:
+        raise ValueError("--output takes a single chart; use --output-dir for several")
+
+    snapshot = build_tracker(args).snapshot()
+    options = {'months': args.months, 'month': args.month, 'year': args.year, 'category': args.category}
+    for name in args.names:
+        method_name, allowed = CHARTS[name]
+        kwargs = {key: options[key] for key in allowed if options[key] is not None}
+        fig = getattr(FinanceVisualizer, method_name)(snapshot, show=False, **kwargs)
+        if fig is None:
+            raise ValueError(f"No data for chart '{name}'")
+
+        if args.output == '-':
+            fig.savefig(out.buffer, format='png')
+            out.flush()
+        else:
+            path = args.output or os.path.join(args.output_dir, f"{name}.png")
+            fig.savefig(path, format='png')
+            print(f"✓ Saved {path}")
+        plt.close(fig)
+    return 0
+
+
+def command_export(args, out):
+    import pandas as pd
+
+    snapshot = build_tracker(args).snapshot()
+    start = pd.Timestamp(args.start) if args.start else None
+    end = pd.Timestamp(args.end) if args.end else None
+    write_frames(iter_transactions(snapshot, start, end), args.format, out)
+    return 0
+
+
+# ---- Entry point ----------------------------------------------------------
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Headless finance tracker commands. Progress messages go to stderr; "
+                    "results go to stdout (or --output) as CSV, JSON or JSON lines.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    reading = argparse.ArgumentParser(add_help=False)
+    reading.add_argument('--jobs', type=int, default=1, help="Parse up to this many input files in parallel")
+    reading.add_argument('--duplicates', choices=['drop', 'flag', 'keep'], default='drop',
+                         help="What to do with rows already seen (default: drop)")
+
+    source = argparse.ArgumentParser(add_help=False, parents=[reading])
+    group = source.add_mutually_exclusive_group()
+    group.add_argument('--ledger', help="Partitioned ledger directory to read")
+    group.add_argument('-i', '--input', action='append', default=[],
+                       help="Transactions CSV ('-' for stdin); repeatable. Default: stdin")
+    source.add_argument('--fx-rates', action='append', default=[], help="FX rates CSV; repeatable")
+    source.add_argument('--currency', help="Reporting currency")
+    source.add_argument('--budget', action='append', default=[], type=parse_budget,
+                        help="Monthly budget as CATEGORY=LIMIT; repeatable")
+    source.add_argument('--budgets', help="CSV of budgets with category and limit columns")
+
+    period = argparse.ArgumentParser(add_help=False)
+    period.add_argument('--month', type=int)
+    period.add_argument('--year', type=int)
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument('--format', choices=FORMATS, default='csv')
+    output.add_argument('-o', '--output', help="Write results to this file instead of stdout")
+
+    command = subparsers.add_parser('import', parents=[reading, output],
+                                    help="Append transaction CSVs to a ledger")
+    command.add_argument('files', nargs='*', help="CSV files ('-' for stdin). Default: stdin")
+    command.add_argument('--ledger', required=True, help="Partitioned ledger directory to append to")
+    command.set_defaults(handler=command_import)
+
+    command = subparsers.add_parser('report', parents=[source, period, output],
+                                    help="Summary (or per-category totals) for a month or date range")
+    command.add_argument('--start', help="Range start date (overrides --month/--year)")
+    command.add_argument('--end', help="Range end date")
+    command.add_argument('--by-category', action='store_true', help="Output per-category totals")
+    command.set_defaults(handler=command_report)
+
+    command = subparsers.add_parser('alerts', parents=[source, period, output],
+                                    help="Budget alerts for a month")
+    command.add_argument('--fail-on-alert', action='store_true',
+                         help=f"Exit with status {ALERTS_EXIT_CODE} when any budget is exceeded")
+    command.set_defaults(handler=command_alerts, start=None, end=None)
+
+    command = subparsers.add_parser('chart', parents=[source, period], help="Render charts to PNG files")
+    command.add_argument('names', nargs='+', help="income-vs-expenses, expense-categories, "
+                                                  "spending-trends or budget-vs-actual")
+    command.add_argument('--months', type=int)
+    command.add_argument('--category')
+    command.add_argument('-o', '--output', help="PNG path for a single chart ('-' for stdout)")
+    command.add_argument('--output-dir', default='.', help="Directory for <name>.png files")
+    command.set_defaults(handler=command_chart)
+
+    command = subparsers.add_parser('export', parents=[source, output], help="Stream transactions")
+    command.add_argument('--start', help="Only transactions on or after this date")
+    command.add_argument('--end', help="Only transactions on or before this date")
+    command.set_defaults(handler=command_export)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    out = sys.stdout
+    try:
+        with contextlib.ExitStack() as stack:
+            if getattr(args, 'output', None) and args.output != '-' and args.command != 'chart':
+                out = stack.enter_context(open(args.output, 'w', newline=''))
+            # The tracker reports progress with print(); keep stdout for results only
+            with contextlib.redirect_stdout(sys.stderr):
+                return args.handler(args, out)
+    except BrokenPipeError:
+        return 0
+    except Exception as excep:
+        print(f"Error: {excep}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
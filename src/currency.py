@@ -0,0 +1,110 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+CURRENCY_SYMBOLS = {
+    'USD': '$', 'EUR': '€', 'GBP': '£', 'JPY': '¥', 'CNY': '¥', 'INR': '₹',
+    'KRW': '₩', 'CAD': 'C$', 'AUD': 'A$', 'NZD': 'NZ$', 'MXN': 'MX$', 'BRL': 'R$'
+}
+
+
+def currency_symbol(currency):
+    """Short display symbol for a currency code (falls back to the code itself)"""
+    return CURRENCY_SYMBOLS.get(currency, currency)
+
+
+def format_amount(amount, currency='USD'):
+    """Format an amount for display, e.g. $12.50, €3.00 or CHF 7.25"""
+    symbol = CURRENCY_SYMBOLS.get(currency)
+    if symbol is None:
+        return f"{currency} {amount:.2f}"
+    if amount < 0:
+        return f"-{symbol}{-amount:.2f}"
+    return f"{symbol}{amount:.2f}"
+
+
+class FXRates:
+    """
+    Local table of dated exchange rates, each giving the value of one unit of a currency
+    in the pivot currency. Conversions use the latest rate on or before each transaction date.
+    The table is replaced (never mutated) on change and `version` is bumped, so callers can
+    key cached conversions on it.
+    """
+
+    def __init__(self, pivot='USD'):
+        self.pivot = pivot
+        self.version = 0
+        self._lock = threading.Lock()
+        self.table = pd.DataFrame({'date': pd.Series(dtype='datetime64[ns]'),
+                                   'currency': pd.Series(dtype=object),
+                                   'rate': pd.Series(dtype=float)})
+
+    @classmethod
+    def from_csv(cls, filename, pivot='USD'):
+        rates = cls(pivot)
+        rates.load_csv(filename)
+        return rates
+
+    def load_csv(self, filename):
+        """Load rates from a CSV with date, currency and rate columns (merged with existing rates)"""
+        self.add_rates(pd.read_csv(filename))
+
+    def add_rates(self, rates):
+        """Add or replace rates from a DataFrame or list of dicts with date, currency and rate"""
+        rates = pd.DataFrame(rates)
+        missing = [column for column in ['date', 'currency', 'rate'] if column not in rates]
+        if missing:
+            raise ValueError(f"Missing FX rate columns: {', '.join(missing)}")
+
+        rates = rates[['date', 'currency', 'rate']].copy()
+        rates['date'] = pd.to_datetime(rates['date']).astype('datetime64[ns]')
+        rates['currency'] = rates['currency'].astype(str).str.upper().astype(object)
+        rates['rate'] = pd.to_numeric(rates['rate']).astype(float)
+        if (rates['rate'] <= 0).any():
+            raise ValueError("FX rates must be positive")
+
+        with self._lock:
+            table = pd.concat([self.table, rates], ignore_index=True)
+            table = table.drop_duplicates(['date', 'currency'], keep='last')
+            self.table = table.sort_values('date', kind='stable').reset_index(drop=True)
+            self.version += 1
+
+    def currencies(self):
+        return {self.pivot, *self.table['currency'].unique()}
+
+    def _rates_asof(self, table, dates, currencies):
+        """Vectorized as-of lookup of the pivot rate for each (date, currency) pair"""
+        rates = np.ones(len(dates))
+        needs_rate = currencies != self.pivot
+        if not needs_rate.any():
+            return rates
+
+        left = pd.DataFrame({'date': dates[needs_rate], 'currency': pd.Series(currencies[needs_rate], dtype=object),
+                             'row': np.flatnonzero(needs_rate)}).sort_values('date', kind='stable')
+
+        backward = pd.merge_asof(left, table, on='date', by='currency', direction='backward')
+        # Dates before a currency's first rate use that first rate
+        if backward['rate'].isna().any():
+            forward = pd.merge_asof(left, table, on='date', by='currency', direction='forward')
+            backward['rate'] = backward['rate'].fillna(forward['rate'])
+
+        unknown = backward.loc[backward['rate'].isna(), 'currency'].unique()
+        if len(unknown):
+            raise ValueError(f"No FX rates for: {', '.join(sorted(unknown))}")
+
+        rates[backward['row'].to_numpy()] = backward['rate'].to_numpy()
+        return rates
+
+    def convert(self, amounts, currencies, dates, target):
+        """Convert amounts from per-row currencies to the target currency in one pass"""
+        amounts = np.asarray(amounts, dtype=float)
+        currencies = np.asarray(currencies, dtype=object)
+        if len(amounts) == 0 or (currencies == target).all():
+            return amounts
+
+        dates = pd.to_datetime(pd.Series(dates)).astype('datetime64[ns]').to_numpy()
+        table = self.table
+        source_rates = self._rates_asof(table, dates, currencies)
+        target_rates = self._rates_asof(table, dates, np.full(len(dates), target, dtype=object))
+        return amounts * source_rates / target_rates
@@ -1,3 +1,6 @@
+import numpy as np
+import pandas as pd
+
 # Remove the relative import dots since we're running from main.py
 from finance_tracker import PersonalFinanceTracker
 from visualizer import FinanceVisualizer
@@ -71,8 +74,8 @@ def run_full_demo():
     alerts = tracker.check_budget_alerts(2, 2024)
     if alerts:
         for alert in alerts:
-            print(f"  ⚠️  {alert['category']}: Spent ${alert['amount_spent']:.2f} "
-                  f"(Budget: ${alert['budget_limit']:.2f})")
+            print(f"  ⚠️  {alert['category']}: Spent {tracker.format_amount(alert['amount_spent'])} "
+                  f"(Budget: {tracker.format_amount(alert['budget_limit'])})")
     else:
         print("  ✓ All categories within budget!")
 
@@ -109,7 +112,7 @@ def run_full_demo():
         top_categories = cat_analysis['expense_by_category'].sort_values(ascending=False).head(3)
         for category, amount in top_categories.items():
             percentage = (amount / total_expenses * 100) if total_expenses > 0 else 0
-            print(f"  {category}: ${amount:.2f} ({percentage:.1f}%)")
+            print(f"  {category}: {tracker.format_amount(amount)} ({percentage:.1f}%)")
 
     return tracker
 
@@ -140,6 +143,41 @@ def create_sample_data():
 
     return tracker
 
+def generate_random_transactions(count=10000, start_date='2015-01-01', end_date='2024-12-31', seed=0):
+    """Generate a reproducible synthetic ledger as a DataFrame (for load tests and benchmarks)"""
+    rng = np.random.default_rng(seed)
+
+    expense_items = [
+        ('Food', 'Groceries', 80), ('Food', 'Restaurant dinner', 45), ('Food', 'Coffee shop', 6),
+        ('Housing', 'Rent', 1200), ('Transportation', 'Gas', 50), ('Transportation', 'Bus pass', 90),
+        ('Entertainment', 'Netflix subscription', 15), ('Entertainment', 'Concert tickets', 120),
+        ('Shopping', 'Amazon order', 60), ('Utilities', 'Electricity bill', 95),
+        ('Healthcare', 'Pharmacy', 25), ('Education', 'Online course', 200)
+    ]
+    income_items = [('Salary', 'Monthly Salary', 3500), ('Freelance', 'Web design project', 800),
+                    ('Investment', 'Dividend payout', 150)]
+    methods = np.array(['Cash', 'Credit Card', 'Debit Card', 'Bank Transfer', 'PayPal'])
+
+    is_income = rng.random(count) < 0.1
+    expense_choice = rng.integers(0, len(expense_items), count)
+    income_choice = rng.integers(0, len(income_items), count)
+    items = [income_items[i] if income else expense_items[e]
+             for income, e, i in zip(is_income, expense_choice, income_choice)]
+
+    start = pd.Timestamp(start_date)
+    span_days = (pd.Timestamp(end_date) - start).days + 1
+    dates = start + pd.to_timedelta(np.sort(rng.integers(0, span_days, count)), unit='D')
+    base_amounts = np.array([item[2] for item in items], dtype=float)
+
+    return pd.DataFrame({
+        'date': dates,
+        'type': np.where(is_income, 'income', 'expense'),
+        'category': [item[0] for item in items],
+        'description': [item[1] for item in items],
+        'amount': np.round(base_amounts * rng.uniform(0.7, 1.3, count), 2),
+        'payment_method': methods[rng.integers(0, len(methods), count)]
+    })
+
 if __name__ == "__main__":
     # This allows you to run the demo directly
     tracker = run_full_demo()
@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+
+GRANULARITIES = ['D', 'W', 'M', 'Q', 'Y']
+GRANULARITY_LABELS = {'D': 'Daily', 'W': 'Weekly', 'M': 'Monthly', 'Q': 'Quarterly', 'Y': 'Yearly'}
+
+# Automatic resolution never goes finer than months; ask for 'D' or 'W' explicitly
+AUTO_FINEST_GRANULARITY = 'M'
+
+
+def point_budget(width_px, pixels_per_point=3):
+    """How many points a chart of the given pixel width can usefully show"""
+    return max(2, int(width_px // pixels_per_point))
+
+
+def count_periods(start, end, granularity):
+    start = pd.Timestamp(start).to_period(granularity)
+    end = pd.Timestamp(end).to_period(granularity)
+    return end.ordinal - start.ordinal + 1
+
+
+def choose_granularity(start, end, max_points, finest=AUTO_FINEST_GRANULARITY):
+    """Pick the finest granularity (no finer than `finest`) whose period count fits max_points"""
+    for granularity in GRANULARITIES[GRANULARITIES.index(finest):]:
+        if count_periods(start, end, granularity) <= max_points:
+            return granularity
+    return GRANULARITIES[-1]
+
+
+def period_starts(dates, granularity):
+    """Start date of each date's period, computed on datetime64 arrays (no Period objects)"""
+    days = pd.to_datetime(dates).to_numpy(dtype='datetime64[D]')
+    if granularity == 'D':
+        return days
+    if granularity == 'W':
+        # Weeks start on Monday; 1970-01-01 (day 0) was a Thursday
+        day_numbers = days.astype(np.int64)
+        return (day_numbers - (day_numbers + 3) % 7).astype('datetime64[D]')
+    if granularity == 'M':
+        return days.astype('datetime64[M]').astype('datetime64[D]')
+    if granularity == 'Q':
+        months = days.astype('datetime64[M]').astype(np.int64)
+        return (months - months % 3).astype('datetime64[M]').astype('datetime64[D]')
+    if granularity == 'Y':
+        return days.astype('datetime64[Y]').astype('datetime64[D]')
+    raise ValueError(f"Granularity must be one of {', '.join(GRANULARITIES)}")
+
+
+def aggregate_by_period(dates, values, granularity):
+    """Sum values per calendar period; returns a Series indexed by period start timestamps"""
+    starts = period_starts(dates, granularity)
+    unique_starts, codes = np.unique(starts, return_inverse=True)
+    totals = np.bincount(codes.ravel(), weights=np.asarray(values, dtype=float), minlength=len(unique_starts))
+    return pd.Series(totals, index=pd.DatetimeIndex(unique_starts.astype('datetime64[ns]')))
+
+
+def lttb(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets: indices of `threshold` points that keep the visual shape.
+    Each bucket's work is vectorized; only the bucket walk itself is a Python loop.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    length = len(x)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    edges = np.floor(np.linspace(1, length - 1, threshold - 1)).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = length - 1
+
+    # Average point of every bucket, used as the third triangle vertex
+    counts = np.diff(edges)
+    sums_x = np.add.reduceat(x[:edges[-1]], edges[:-1])
+    sums_y = np.add.reduceat(y[:edges[-1]], edges[:-1])
+    averages_x = np.append(sums_x / counts, x[-1])
+    averages_y = np.append(sums_y / counts, y[-1])
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        bucket_x, bucket_y = x[start:end], y[start:end]
+        areas = np.abs((x[previous] - averages_x[bucket + 1]) * (bucket_y - y[previous]) -
+                       (x[previous] - bucket_x) * (averages_y[bucket + 1] - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
+
+
+def minmax_downsample(y, max_points):
+    """Keep the minimum and maximum of each bin (fully vectorized), preserving spikes"""
+    y = np.asarray(y, dtype=float)
+    length = len(y)
+    bins = max_points // 2
+    if bins < 1 or length <= max_points:
+        return np.arange(length)
+
+    edges = np.floor(np.linspace(0, length, bins + 1)).astype(np.int64)
+    bin_ids = np.repeat(np.arange(bins), np.diff(edges))
+    # Sorting by (bin, value) puts each bin's minimum at its first slot and maximum at its last
+    order = np.lexsort((y, bin_ids))
+    return np.unique(np.concatenate((order[edges[:-1]], order[edges[1:] - 1])))
+
+
+def downsample(series, max_points, method='lttb'):
+    """Reduce a time-indexed Series to at most max_points using LTTB or min/max binning"""
+    if len(series) <= max_points:
+        return series
+    if method == 'lttb':
+        x = series.index.asi8 if isinstance(series.index, pd.DatetimeIndex) else np.arange(len(series))
+        keep = lttb(x, series.values, max_points)
+    elif method == 'minmax':
+        keep = minmax_downsample(series.values, max_points)
+    else:
+        raise ValueError("Downsampling method must be 'lttb' or 'minmax'")
+    return series.iloc[keep]
@@ -1,47 +1,174 @@
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for better visualizations
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
-
-class PersonalFinanceTracker:
-    def __init__(self):
-        self.transactions = pd.DataFrame(columns=[
-            'date', 'type', 'category', 'description', 'amount', 'payment_method'
-        ])
-        self.categories = {
-            'income': ['Salary', 'Freelance', 'Investment', 'Gift', 'Other Income'],
-            'expense': ['Food', 'Transportation', 'Housing', 'Entertainment',
-                        'Healthcare', 'Education', 'Shopping', 'Utilities', 'Other']
-        }
-        self.budget_limits = {}
-
-    def add_transaction(self, date, trans_type, category, description, amount, payment_method='Cash'):
-        """Add a new transaction to the tracker"""
-        if trans_type not in ['income', 'expense']:
-            raise ValueError("Transaction type must be 'income' or 'expense'")
-
-        new_transaction = pd.DataFrame([{
-            'date': pd.to_datetime(date),
-            'type': trans_type,
-            'category': category,
-            'description': description,
-            'amount': amount,
-            'payment_method': payment_method
-        }])
+try:
+    from .search_index import DescriptionIndex
+    from .fingerprint_index import FingerprintIndex, fingerprint_transactions
+    from .currency import FXRates, format_amount
+    from .partitioned_ledger import PartitionedLedger
+    from .warm_cache import WarmCache, aggregate_totals, build_derived, content_fingerprint, merge_totals
+except ImportError:
+    from search_index import DescriptionIndex
+    from fingerprint_index import FingerprintIndex, fingerprint_transactions
+    from currency import FXRates, format_amount
+    from partitioned_ledger import PartitionedLedger
+    from warm_cache import WarmCache, aggregate_totals, build_derived, content_fingerprint, merge_totals
+
+TRANSACTION_COLUMNS = ['date', 'type', 'category', 'description', 'amount', 'payment_method', 'currency']
+
+def build_transaction_frame(transactions, default_currency='USD'):
+    """
+    Validate a list of transaction dicts (or a DataFrame) and return it as a transactions frame.
+    Missing payment methods default to 'Cash' and missing currencies to default_currency;
+    extra columns are kept after the standard ones.
+    """
+    frame = pd.DataFrame(transactions)
+    if len(frame) == 0:
+        return pd.DataFrame(columns=TRANSACTION_COLUMNS).astype({'date': 'datetime64[ns]', 'amount': 'float64'})
+
+    missing = [column for column in ['date', 'type', 'category', 'description', 'amount']
+               if column not in frame]
+    if missing:
+        raise ValueError(f"Missing transaction fields: {', '.join(missing)}")
+    if not frame['type'].isin(['income', 'expense']).all():
+        raise ValueError("Transaction type must be 'income' or 'expense'")
+
+    if 'payment_method' not in frame:
+        frame['payment_method'] = 'Cash'
+    frame['payment_method'] = frame['payment_method'].fillna('Cash')
+    if 'currency' not in frame:
+        frame['currency'] = default_currency
+    frame['currency'] = frame['currency'].fillna(default_currency).astype(str).str.upper()
+    frame['date'] = pd.to_datetime(frame['date'])
+    frame['amount'] = pd.to_numeric(frame['amount']).astype(float)
+
+    extra_columns = [column for column in frame.columns if column not in TRANSACTION_COLUMNS]
+    return frame[TRANSACTION_COLUMNS + extra_columns].reset_index(drop=True)
+
+class LedgerSnapshot:
+    """
+    Immutable, consistent view of the tracker at one version.
+    All reports run against a snapshot, so concurrent writers can never tear them;
+    treat transactions and budget_limits as read-only.
+
+    When the tracker is attached to a PartitionedLedger the snapshot holds the ledger's
+    partition table instead of a frame, and reports load only the partitions they need.
+    If it also holds per-day totals (from the warm-start cache) reports read no partitions at all.
+    """
+
+    def __init__(self, transactions, budget_limits, categories, version,
+                 fx_rates=None, reporting_currency='USD', converted=None, ledger=None, partitions=None,
+                 totals=None):
+        self._transactions = transactions
+        self.ledger = ledger
+        self.partitions = partitions
+        self.totals = totals
+        self.budget_limits = MappingProxyType(dict(budget_limits))
+        self.categories = categories
+        self.version = version
+        self.fx_rates = fx_rates
+        self.reporting_currency = reporting_currency
+        self._converted = converted
+
+    def snapshot(self):
+        return self
+
+    @property
+    def transactions(self):
+        """All transactions (loads every partition when backed by a ledger)"""
+        if self._transactions is None:
+            loaded = self.ledger.load(partitions=self.partitions)
+            self._transactions = build_transaction_frame([]) if loaded is None else loaded
+        return self._transactions
+
+    @property
+    def row_count(self):
+        if self._transactions is None:
+            return self.ledger.row_count(self.partitions)
+        return len(self._transactions)
+
+    def date_range(self):
+        """Earliest and latest transaction dates, or (None, None) when empty"""
+        if self._transactions is None:
+            if not self.partitions:
+                return None, None
+            return (min(pd.Timestamp(info['min_date']) for info in self.partitions.values()),
+                    max(pd.Timestamp(info['max_date']) for info in self.partitions.values()))
+        if len(self._transactions) == 0:
+            return None, None
+        return self._transactions['date'].min(), self._transactions['date'].max()
+
+    def transactions_between(self, start_date=None, end_date=None):
+        """
+        Transactions in the reporting currency covering at least [start_date, end_date].
+        With a ledger only the overlapping partitions are read; in memory the full frame is
+        returned as is. Either way callers still apply their own date filter.
+        """
+        if self._transactions is not None or self.ledger is None:
+            return self.report_transactions
+
+        loaded = self.ledger.load(start_date, end_date, partitions=self.partitions)
+        if loaded is None:
+            return build_transaction_frame([])
+        return self._to_reporting_currency(loaded)
+
+    def totals_between(self, start_date=None, end_date=None):
+        """
+        Like transactions_between, but answered from the per-day totals when they are loaded:
+        one row per (date, type, category, currency) with summed amount and a row count.
+        """
+        if self.totals is None:
+            return self.transactions_between(start_date, end_date)
+
+        dates = self.totals['date'].to_numpy()
+        start = 0 if start_date is None else dates.searchsorted(pd.Timestamp(start_date).to_datetime64(), 'left')
+        end = len(dates) if end_date is None else dates.searchsorted(pd.Timestamp(end_date).to_datetime64(), 'right')
+        return self._to_reporting_currency(self.totals.iloc[start:end].reset_index(drop=True))
+
+    def _to_reporting_currency(self, transactions):
+        currencies = transactions['currency'].fillna(self.reporting_currency)
+        if (currencies == self.reporting_currency).all():
+            return transactions
+        if self.fx_rates is None:
+            raise ValueError("FX rates are required to report in a single currency")
+        amounts = self.fx_rates.convert(transactions['amount'], currencies, transactions['date'],
+                                        self.reporting_currency)
+        return transactions.assign(original_amount=transactions['amount'], amount=amounts)
+
+    def format_amount(self, amount):
+        return format_amount(amount, self.reporting_currency)
+
+    def _conversion_key(self):
+        return self.reporting_currency, self.fx_rates.version if self.fx_rates is not None else None
+
+    @property
+    def report_transactions(self):
+        """
+        Transactions with 'amount' in the reporting currency (original values kept in
+        'original_amount'). Conversion is cached per FX table version; rows already
+        converted for the previous snapshot are reused, so only appended rows are converted.
+        """
+        key = self._conversion_key()
+        cached = self._converted
+        if cached is not None and cached[0] == key and len(cached[1]) == len(self.transactions):
+            return cached[1]
 
-        self.transactions = pd.concat([self.transactions, new_transaction], ignore_index=True)
-        print(f"✓ Added {trans_type}: {description} - ${amount:.2f}")
+        transactions = self.transactions
+        reused = cached[1] if cached is not None and cached[0] == key and len(cached[1]) < len(transactions) \
+            and 'original_amount' in cached[1] else None
+        if reused is None:
+            converted = self._to_reporting_currency(transactions)
+        else:
+            converted = pd.concat([reused, self._to_reporting_currency(transactions.iloc[len(reused):])])
 
-    def set_budget(self, category, monthly_limit):
-        """Set monthly budget for a category"""
-        self.budget_limits[category] = monthly_limit
-        print(f"✓ Budget set for {category}: ${monthly_limit:.2f} per month")
+        self._converted = (key, converted)
+        return converted
 
     def get_financial_summary(self, start_date=None, end_date=None):
         """Get comprehensive financial summary for a period"""
@@ -51,13 +178,14 @@ class PersonalFinanceTracker:
             end_date = pd.to_datetime(end_date)
 
         # Filter transactions by date range
-        mask = pd.Series([True] * len(self.transactions))
+        transactions = self.totals_between(start_date, end_date)
+        mask = pd.Series([True] * len(transactions))
         if start_date is not None:
-            mask = mask & (self.transactions['date'] >= start_date)
+            mask = mask & (transactions['date'] >= start_date)
         if end_date is not None:
-            mask = mask & (self.transactions['date'] <= end_date)
+            mask = mask & (transactions['date'] <= end_date)
 
-        filtered_transactions = self.transactions[mask].copy()
+        filtered_transactions = transactions[mask].copy()
 
         if len(filtered_transactions) == 0:
             print("No transactions in the specified period")
@@ -76,19 +204,20 @@ class PersonalFinanceTracker:
             'savings_rate': savings_rate,
             'avg_daily_expense': expenses / len(filtered_transactions['date'].dt.date.unique())
             if len(filtered_transactions['date'].dt.date.unique()) > 0 else 0,
-            'transaction_count': len(filtered_transactions)
+            'transaction_count': int(filtered_transactions['count'].sum())
+            if 'count' in filtered_transactions else len(filtered_transactions)
         }
 
         return summary
 
     def get_category_analysis(self, start_date=None, end_date=None):
         """Analyze spending/income by category"""
-        if len(self.transactions) == 0:
+        if self.row_count == 0:
             print("No transactions to analyze")
             return None
 
         # Filter by date if provided
-        transactions = self.transactions
+        transactions = self.totals_between(start_date, end_date)
         if start_date or end_date:
             start_date = pd.to_datetime(start_date) if start_date else pd.Timestamp.min
             end_date = pd.to_datetime(end_date) if end_date else pd.Timestamp.max
@@ -126,10 +255,11 @@ class PersonalFinanceTracker:
             end_date = pd.Timestamp(year=year, month=month+1, day=1) - timedelta(days=1)
 
         # Get expenses for the month
-        monthly_expenses = self.transactions[
-            (self.transactions['date'] >= start_date) &
-            (self.transactions['date'] <= end_date) &
-            (self.transactions['type'] == 'expense')
+        transactions = self.totals_between(start_date, end_date)
+        monthly_expenses = transactions[
+            (transactions['date'] >= start_date) &
+            (transactions['date'] <= end_date) &
+            (transactions['type'] == 'expense')
             ]
 
         # Check each budget category
@@ -156,7 +286,7 @@ class PersonalFinanceTracker:
             year = datetime.now().year
 
         print(f"\n{'=' * 50}")
-        print(f"FINANCIAL REPORT - {month}/{year}")
+        print(f"FINANCIAL REPORT - {month}/{year} ({self.reporting_currency})")
         print(f"{'=' * 50}")
 
         # Get summary
@@ -170,29 +300,371 @@ class PersonalFinanceTracker:
 
         if summary:
             print(f"\nSUMMARY:")
-            print(f"  Total Income:    ${summary['total_income']:.2f}")
-            print(f"  Total Expenses:  ${summary['total_expenses']:.2f}")
-            print(f"  Net Savings:     ${summary['net_savings']:.2f}")
+            print(f"  Total Income:    {self.format_amount(summary['total_income'])}")
+            print(f"  Total Expenses:  {self.format_amount(summary['total_expenses'])}")
+            print(f"  Net Savings:     {self.format_amount(summary['net_savings'])}")
             print(f"  Savings Rate:    {summary['savings_rate']:.1f}%")
-            print(f"  Avg Daily Spend: ${summary['avg_daily_expense']:.2f}")
+            print(f"  Avg Daily Spend: {self.format_amount(summary['avg_daily_expense'])}")
 
         # Category analysis
         cat_analysis = self.get_category_analysis(start_date, end_date)
         if cat_analysis:
             print(f"\nINCOME BY CATEGORY:")
             for category, amount in cat_analysis['income_by_category'].items():
-                print(f"  {category}: ${amount:.2f}")
+                print(f"  {category}: {self.format_amount(amount)}")
 
             print(f"\nEXPENSES BY CATEGORY:")
             for category, amount in cat_analysis['expense_by_category'].items():
-                print(f"  {category}: ${amount:.2f}")
+                print(f"  {category}: {self.format_amount(amount)}")
 
         # Budget alerts
         alerts = self.check_budget_alerts(month, year)
         if alerts:
             print(f"\n⚠️  BUDGET ALERTS:")
             for alert in alerts:
-                print(f"  {alert['category']}: Over budget by ${alert['over_by']:.2f} "
+                print(f"  {alert['category']}: Over budget by {self.format_amount(alert['over_by'])} "
                       f"({alert['percentage_over']:.1f}%)")
 
-        print(f"{'=' * 50}")
\ No newline at end of file
+        print(f"{'=' * 50}")
+
+class PersonalFinanceTracker:
+    """
+    Tracks transactions and budgets with snapshot isolation.
+
+    Writers are serialized by a lock and stage rows in a private buffer; each write (or each
+    batch() block) publishes a new LedgerSnapshot in a single attribute assignment. Readers
+    just grab the current snapshot and never take the lock.
+
+    After attach_ledger() the transactions live in a PartitionedLedger on disk: each publish
+    appends the buffered rows to their year-month partitions and reports read only the
+    partitions overlapping their date range.
+    """
+
+    def __init__(self):
+        self.categories = {
+            'income': ['Salary', 'Freelance', 'Investment', 'Gift', 'Other Income'],
+            'expense': ['Food', 'Transportation', 'Housing', 'Entertainment',
+                        'Healthcare', 'Education', 'Shopping', 'Utilities', 'Other']
+        }
+        self.description_index = DescriptionIndex()
+        self.fingerprint_index = FingerprintIndex()
+        self.base_currency = 'USD'
+        self.reporting_currency = 'USD'
+        self.fx_rates = FXRates(pivot=self.base_currency)
+        self._write_lock = threading.RLock()
+        self._batch_depth = 0
+        self._pending = []
+        self._pending_rows = 0
+        self._budgets = {}
+        self.ledger = None
+        self.warm_cache = None
+        self._totals = None
+        self._fingerprints_built = True
+        self._snapshot = LedgerSnapshot(build_transaction_frame([]), {}, self.categories, 0,
+                                        self.fx_rates, self.reporting_currency)
+
+    # ---- Snapshots ------------------------------------------------------------
+
+    def snapshot(self):
+        """Return the current published LedgerSnapshot"""
+        return self._snapshot
+
+    @property
+    def version(self):
+        """Counter incremented on every publish; use it to invalidate derived caches"""
+        return self._snapshot.version
+
+    @property
+    def transactions(self):
+        return self._snapshot.transactions
+
+    @transactions.setter
+    def transactions(self, transactions):
+        """Replace every transaction (in memory only; ledger partitions are append-only)"""
+        with self._write_lock:
+            if self.ledger is not None:
+                raise ValueError("Transactions can't be replaced while a ledger is attached; append instead")
+            transactions = build_transaction_frame(transactions, self.base_currency)
+            self._check_currencies(transactions['currency'].unique())
+            self._pending = []
+            self._pending_rows = 0
+            self._publish(transactions)
+            # Both indexes describe the old rows: rebuild the search index now (later appends
+            # extend it by position) and the fingerprints on the next duplicate check
+            self.description_index = DescriptionIndex()
+            self.description_index.rebuild(transactions['description'])
+            self._fingerprints_built = False
+
+    @property
+    def budget_limits(self):
+        return self._snapshot.budget_limits
+
+    def attach_ledger(self, ledger, warm_start=True):
+        """
+        Store transactions in a PartitionedLedger (or a directory path for one) from now on.
+        Rows already in memory are appended to it; existing partitions are picked up lazily.
+        With warm_start the derived totals and indexes come from the ledger's WarmCache when
+        it matches the ledger content, and are rebuilt and saved there when it doesn't.
+        """
+        if isinstance(ledger, str):
+            ledger = PartitionedLedger(ledger)
+        with self._write_lock:
+            current = self._snapshot.transactions
+            self.ledger = ledger
+            ledger.append(current)
+            # The ledger indexes rows by stable row id rather than position, so start both indexes over
+            self.description_index = DescriptionIndex()
+            self._fingerprints_built = False
+            self._totals = None
+            if warm_start:
+                self.warm_cache = WarmCache(ledger.directory)
+                self._warm_start()
+            self._publish()
+        print(f"✓ Attached ledger at {ledger.directory} ({ledger.row_count()} transactions)")
+
+    def _warm_start(self):
+        """Load derived structures from the warm cache, rebuilding them on a miss. Caller holds the write lock."""
+        fingerprint = content_fingerprint(self.ledger)
+        derived = self.warm_cache.load(fingerprint)
+        if derived is None:
+            transactions = self.ledger.load()
+            derived = build_derived(build_transaction_frame([]) if transactions is None else transactions,
+                                    self.ledger.row_ids())
+            self.warm_cache.save(fingerprint, derived)
+        self._totals = derived['totals']
+        self.fingerprint_index.load(derived['fingerprints'])
+        self._fingerprints_built = True
+        self.description_index.load_state(derived['description_index'])
+
+    def save_warm_cache(self):
+        """
+        Persist the current derived structures so the next attach_ledger() starts warm.
+        Appends keep them current, so rows are only read to build one that was never built.
+        """
+        with self._write_lock:
+            if self.ledger is None:
+                raise ValueError("Warm-start caching needs an attached ledger")
+            self.warm_cache = self.warm_cache or WarmCache(self.ledger.directory)
+            if self._totals is None:
+                self._totals = aggregate_totals(self._snapshot.transactions)
+            if self.description_index.size != self._snapshot.row_count:
+                self.rebuild_description_index()
+            if not self._fingerprints_built:
+                self.rebuild_fingerprint_index()
+            derived = {
+                'totals': self._totals,
+                'fingerprints': self.fingerprint_index.values(),
+                'description_index': self.description_index.state()
+            }
+            self.warm_cache.save(content_fingerprint(self.ledger), derived)
+
+    def _publish(self, transactions=None):
+        """Fold the write buffer into a new snapshot and swap it in. Caller holds the write lock."""
+        previous = self._snapshot
+        converted = None
+        if self.ledger is not None:
+            pending = self._pending
+            self._pending = []
+            self._pending_rows = 0
+            if pending:
+                new_transactions = pd.concat(pending, ignore_index=True)
+                try:
+                    row_ids = self.ledger.append(new_transactions)
+                except Exception:
+                    # The rows never reached the ledger, so their fingerprints must not linger
+                    self._fingerprints_built = False
+                    raise
+                # Stable row ids let the new rows join the postings in place, wherever they landed
+                if self.description_index.size == previous.row_count:
+                    self.description_index.extend(new_transactions['description'], row_ids)
+                if self._totals is not None:
+                    self._totals = merge_totals(self._totals, aggregate_totals(new_transactions))
+            self._snapshot = LedgerSnapshot(None, self._reporting_budgets(), self.categories, previous.version + 1,
+                                            self.fx_rates, self.reporting_currency,
+                                            ledger=self.ledger, partitions=self.ledger.partitions(),
+                                            totals=self._totals)
+            return
+        if transactions is None:
+            transactions = previous.transactions
+            # Appends keep every existing row, so the previous conversion cache stays valid
+            converted = previous._converted
+            if self._pending:
+                transactions = pd.concat([transactions, *self._pending], ignore_index=True)
+        self._pending = []
+        self._pending_rows = 0
+        self._snapshot = LedgerSnapshot(transactions, self._reporting_budgets(), self.categories, previous.version + 1,
+                                        self.fx_rates, self.reporting_currency, converted)
+
+    def set_reporting_currency(self, currency):
+        """Report summaries, alerts and charts in the given currency (budgets are converted to it)"""
+        currency = currency.upper()
+        self._check_currencies([currency])
+        with self.batch():
+            self.reporting_currency = currency
+        print(f"✓ Reporting currency set to {currency}")
+
+    def load_fx_rates(self, filename):
+        """Load dated FX rates (date, currency, rate in base currency) from a local CSV file"""
+        with self.batch():
+            self.fx_rates.load_csv(filename)
+        print(f"✓ FX rates loaded from {filename}")
+
+    def _check_currencies(self, currencies):
+        """Raise ValueError for currencies that have no FX rates, so reports never hit them later"""
+        unknown = set(currencies) - self.fx_rates.currencies() - {self.reporting_currency}
+        if unknown:
+            raise ValueError(f"No FX rates for: {', '.join(sorted(unknown))}")
+
+    def format_amount(self, amount, currency=None):
+        return format_amount(amount, currency or self.reporting_currency)
+
+    @contextmanager
+    def batch(self):
+        """Group several writes into one published version (other writers wait, readers don't)"""
+        with self._write_lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._publish()
+
+    def _stage(self, new_transactions):
+        """Buffer new rows and index them; returns the row position of the first one"""
+        first_row = self._snapshot.row_count + self._pending_rows
+        self._pending.append(new_transactions)
+        self._pending_rows += len(new_transactions)
+        return first_row
+
+    # ---- Writes ---------------------------------------------------------------
+
+    def add_transaction(self, date, trans_type, category, description, amount, payment_method='Cash',
+                        currency=None):
+        """Add a new transaction to the tracker (in the base currency unless one is given)"""
+        if trans_type not in ['income', 'expense']:
+            raise ValueError("Transaction type must be 'income' or 'expense'")
+        currency = (currency or self.base_currency).upper()
+        self._check_currencies([currency])
+
+        new_transaction = pd.DataFrame([{
+            'date': pd.to_datetime(date),
+            'type': trans_type,
+            'category': category,
+            'description': description,
+            'amount': amount,
+            'payment_method': payment_method,
+            'currency': currency
+        }])
+
+        with self.batch():
+            row = self._stage(new_transaction)
+            if self.ledger is None and self.description_index.size == row:
+                self.description_index.add(row, description)
+            self.fingerprint_index.add(fingerprint_transactions(new_transaction))
+        print(f"✓ Added {trans_type}: {description} - {format_amount(amount, currency)}")
+
+    def add_transactions(self, transactions):
+        """Add many transactions (list of dicts or DataFrame) in a single append"""
+        new_transactions = build_transaction_frame(transactions, self.base_currency)
+        if len(new_transactions) == 0:
+            return 0
+        self._check_currencies(new_transactions['currency'].unique())
+
+        with self.batch():
+            first_row = self._stage(new_transactions)
+            if self.ledger is None and self.description_index.size == first_row:
+                self.description_index.extend(new_transactions['description'])
+            self.fingerprint_index.add(fingerprint_transactions(new_transactions))
+        print(f"✓ Added {len(new_transactions)} transactions")
+        return len(new_transactions)
+
+    def set_budget(self, category, monthly_limit, currency=None):
+        """Set monthly budget for a category (in the reporting currency unless one is given)"""
+        currency = (currency or self.reporting_currency).upper()
+        self._check_currencies([currency])
+        with self.batch():
+            self._budgets[category] = (monthly_limit, currency)
+        print(f"✓ Budget set for {category}: {format_amount(monthly_limit, currency)} per month")
+
+    def _reporting_budgets(self):
+        """Budget limits converted to the reporting currency at the latest FX rates"""
+        if not self._budgets:
+            return {}
+        limits, currencies = zip(*self._budgets.values())
+        converted = self.fx_rates.convert(limits, currencies, [pd.Timestamp.now()] * len(limits),
+                                          self.reporting_currency)
+        return dict(zip(self._budgets, converted.tolist()))
+
+    def rebuild_description_index(self):
+        """Rebuild the description search index after bulk changes to transactions"""
+        with self._write_lock:
+            snapshot = self._snapshot
+            row_ids = None if self.ledger is None else self.ledger.row_ids(snapshot.partitions)
+            self.description_index.rebuild(snapshot.transactions['description'], row_ids)
+
+    def rebuild_fingerprint_index(self):
+        """Rebuild the duplicate-detection index from all transactions"""
+        with self._write_lock:
+            self.fingerprint_index.rebuild(self.transactions)
+            self._fingerprints_built = True
+
+    # ---- Reads ----------------------------------------------------------------
+
+    def find_duplicates(self, transactions):
+        """
+        Flag rows that already exist in the tracker, matched on date, amount,
+        normalized description and payment method. Returns a boolean array.
+        """
+        if not self._fingerprints_built:
+            self.rebuild_fingerprint_index()
+        return self.fingerprint_index.duplicates(fingerprint_transactions(transactions))
+
+    def search_transactions(self, query, mode='and', prefix=False, start_date=None, end_date=None,
+                            trans_type=None, category=None):
+        """
+        Find transactions whose description matches the query terms.
+        Terms ending in '*' match as prefixes; mode is 'and' (all terms) or 'or' (any term).
+        """
+        snapshot = self.snapshot()
+        if self.description_index.size < snapshot.row_count:
+            with self._write_lock:
+                if self.description_index.size < self._snapshot.row_count:
+                    self.rebuild_description_index()
+
+        # The index may already hold rows from writes not yet published; skip those
+        rows = self.description_index.query(query, mode=mode, prefix=prefix)
+        if snapshot.partitions is not None:
+            # Ledger postings hold stable row ids, so only the matching rows' partitions are read
+            results = snapshot.ledger.load_rows(rows, start_date, end_date, partitions=snapshot.partitions)
+            results = build_transaction_frame([]) if results is None else results
+        else:
+            transactions = snapshot.transactions
+            results = transactions.iloc[rows[rows < len(transactions)]]
+
+        if start_date is not None:
+            results = results[results['date'] >= pd.to_datetime(start_date)]
+        if end_date is not None:
+            results = results[results['date'] <= pd.to_datetime(end_date)]
+        if trans_type is not None:
+            results = results[results['type'] == trans_type]
+        if category is not None:
+            results = results[results['category'] == category]
+
+        return results
+
+    def get_financial_summary(self, start_date=None, end_date=None):
+        """Get comprehensive financial summary for a period"""
+        return self.snapshot().get_financial_summary(start_date, end_date)
+
+    def get_category_analysis(self, start_date=None, end_date=None):
+        """Analyze spending/income by category"""
+        return self.snapshot().get_category_analysis(start_date, end_date)
+
+    def check_budget_alerts(self, month=None, year=None):
+        """Check if any categories are over budget"""
+        return self.snapshot().check_budget_alerts(month, year)
+
+    def generate_monthly_report(self, month=None, year=None):
+        """Generate comprehensive monthly report"""
+        return self.snapshot().generate_monthly_report(month, year)
@@ -0,0 +1,121 @@
+import threading
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+FINGERPRINT_COLUMNS = ['date', 'amount', 'description', 'payment_method']
+
+
+def fingerprint_transactions(transactions):
+    """
+    Hash each row's (date, amount, normalized description, payment_method) to a uint64.
+    Dates are compared by day, amounts by cent, and text case- and whitespace-insensitively.
+    """
+    if len(transactions) == 0:
+        return np.empty(0, dtype=np.uint64)
+
+    def normalize_text(column):
+        if column not in transactions:
+            return pd.Series('', index=transactions.index)
+        return (transactions[column].fillna('').astype(str)
+                .str.replace(r'\s+', ' ', regex=True).str.strip().str.lower())
+
+    dates = pd.to_datetime(transactions['date']).dt.normalize().astype('datetime64[ns]')
+    keys = pd.DataFrame({
+        'date': dates.astype('int64'),
+        'amount': np.round(pd.to_numeric(transactions['amount']).to_numpy(dtype=float) * 100).astype(np.int64),
+        'description': normalize_text('description'),
+        'payment_method': normalize_text('payment_method')
+    }, index=transactions.index)
+
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy(dtype=np.uint64)
+
+
+class FingerprintIndex:
+    """
+    Multiset of transaction fingerprints for duplicate detection. Identical purchases really
+    do happen, so each fingerprint keeps a count. Bulk loads go into a hashed pd.Index of the
+    unique fingerprints with a parallel counts array; single inserts go into a small Counter
+    that is folded in once it grows, so lookups and inserts stay O(1) amortized.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._base = pd.Index(np.empty(0, dtype=np.uint64))
+        self._counts = np.empty(0, dtype=np.int64)
+        self._recent = Counter()
+
+    def __len__(self):
+        return int(self._counts.sum()) + sum(self._recent.values())
+
+    @staticmethod
+    def _count_sorted(fingerprints):
+        """Unique values and their counts from an already sorted uint64 array"""
+        if len(fingerprints) == 0:
+            return pd.Index(np.empty(0, dtype=np.uint64)), np.empty(0, dtype=np.int64)
+        starts = np.concatenate(([0], np.flatnonzero(fingerprints[1:] != fingerprints[:-1]) + 1))
+        counts = np.diff(np.append(starts, len(fingerprints)))
+        return pd.Index(fingerprints[starts]), counts
+
+    def rebuild(self, transactions):
+        """Recompute the index from scratch for the given transactions"""
+        self.load(np.sort(fingerprint_transactions(transactions)))
+
+    def load(self, fingerprints):
+        """Replace the index with sorted fingerprints, repeated once per transaction (as from values())"""
+        base, counts = self._count_sorted(np.asarray(fingerprints, dtype=np.uint64))
+        with self._lock:
+            self._base = base
+            self._counts = counts
+            self._recent = Counter()
+
+    def values(self):
+        """Every fingerprint in the index, sorted, repeated once per transaction"""
+        with self._lock:
+            self._compact()
+            return np.repeat(self._base.to_numpy(dtype=np.uint64), self._counts)
+
+    def add(self, fingerprints):
+        with self._lock:
+            self._recent.update(int(fingerprint) for fingerprint in fingerprints)
+            if len(self._recent) > max(1024, len(self._base) // 4):
+                self._compact()
+
+    def _compact(self):
+        if not self._recent:
+            return
+        recent = np.fromiter(self._recent.keys(), dtype=np.uint64, count=len(self._recent))
+        recent_counts = np.fromiter(self._recent.values(), dtype=np.int64, count=len(self._recent))
+        merged = np.concatenate((self._base.to_numpy(dtype=np.uint64), recent))
+        order = np.argsort(merged, kind='stable')
+        base, _ = self._count_sorted(merged[order])
+        group = np.searchsorted(base.to_numpy(dtype=np.uint64), merged)
+        self._counts = np.bincount(group, weights=np.concatenate((self._counts, recent_counts)),
+                                   minlength=len(base)).astype(np.int64)
+        self._base = base
+        self._recent = Counter()
+
+    def counts(self, fingerprints):
+        """How many indexed transactions have each fingerprint (vectorized)"""
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        with self._lock:
+            base, counts, recent = self._base, self._counts, self._recent
+            recent_counts = np.fromiter((recent.get(int(fingerprint), 0) for fingerprint in fingerprints),
+                                        dtype=np.int64, count=len(fingerprints)) if recent else None
+        positions = base.get_indexer(fingerprints)
+        found = np.where(positions >= 0, counts[positions] if len(counts) else 0, 0)
+        return found if recent_counts is None else found + recent_counts
+
+    def contains(self, fingerprints):
+        """Vectorized membership test returning a boolean array"""
+        return self.counts(fingerprints) > 0
+
+    def duplicates(self, fingerprints):
+        """
+        Flag the rows of a batch that are already indexed, occurrence by occurrence: if k copies
+        of a fingerprint are indexed, the first k rows with it are duplicates and the rest are new.
+        """
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        occurrence = pd.Series(fingerprints).groupby(fingerprints, sort=False).cumcount().to_numpy()
+        return occurrence < self.counts(fingerprints)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Load test for the finance API server.
+
+Starts a server in-process on a seeded synthetic ledger (or targets --host/--port of a
+running one) and reports p50/p99 latency and throughput per endpoint.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from api_server import FinanceAPIServer
+from demo import generate_random_transactions
+from finance_tracker import PersonalFinanceTracker
+
+READ_REQUESTS = [
+    ('GET', '/summary?start_date=2024-01-01&end_date=2024-12-31', None),
+    ('GET', '/categories?start_date=2024-01-01&end_date=2024-03-31', None),
+    ('GET', '/alerts?month=6&year=2024', None),
+    ('GET', '/search?q=netflix&start_date=2024-01-01', None),
+]
+CHART_REQUEST = ('GET', '/charts/income-vs-expenses?months=12', None)
+
+
+def make_write_request(rng):
+    record = {
+        'date': f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        'type': 'expense',
+        'category': rng.choice(['Food', 'Shopping', 'Transportation']),
+        'description': rng.choice(['Groceries', 'Amazon order', 'Gas']),
+        'amount': round(rng.uniform(5, 200), 2),
+        'payment_method': 'Credit Card'
+    }
+    return 'POST', '/transactions', json.dumps(record).encode('utf-8')
+
+
+async def send_request(reader, writer, host, method, path, body):
+    body = body or b''
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n").encode('latin-1') + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, requests, latencies, errors, rng, write_ratio, chart_ratio):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(requests):
+            roll = rng.random()
+            if roll < write_ratio:
+                method, path, body = make_write_request(rng)
+            elif roll < write_ratio + chart_ratio:
+                method, path, body = CHART_REQUEST
+            else:
+                method, path, body = rng.choice(READ_REQUESTS)
+
+            started = time.perf_counter()
+            status = await send_request(reader, writer, host, method, path, body)
+            elapsed = time.perf_counter() - started
+
+            endpoint = f"{method} {path.split('?')[0]}"
+            latencies.setdefault(endpoint, []).append(elapsed)
+            if status >= 400:
+                errors[endpoint] = errors.get(endpoint, 0) + 1
+    finally:
+        writer.close()
+
+
+def print_report(latencies, errors, duration):
+    print(f"\n{'Endpoint':<32}{'Count':>8}{'p50 (ms)':>12}{'p99 (ms)':>12}{'Errors':>8}")
+    print("-" * 72)
+    all_latencies = []
+    for endpoint, values in sorted(latencies.items()):
+        values = np.array(values) * 1000
+        all_latencies.extend(values)
+        print(f"{endpoint:<32}{len(values):>8}{np.percentile(values, 50):>12.2f}"
+              f"{np.percentile(values, 99):>12.2f}{errors.get(endpoint, 0):>8}")
+    print("-" * 72)
+    all_latencies = np.array(all_latencies)
+    print(f"{'TOTAL':<32}{len(all_latencies):>8}{np.percentile(all_latencies, 50):>12.2f}"
+          f"{np.percentile(all_latencies, 99):>12.2f}{sum(errors.values()):>8}")
+    print(f"\nThroughput: {len(all_latencies) / duration:.1f} requests/second over {duration:.2f}s")
+
+
+async def run_load_test(args):
+    server = None
+    host, port = args.host, args.port
+    if port is None:
+        plt.switch_backend('Agg')
+        tracker = PersonalFinanceTracker()
+        tracker.add_transactions(generate_random_transactions(args.rows, seed=args.seed))
+        for category, limit in [('Food', 300), ('Shopping', 200), ('Entertainment', 150)]:
+            tracker.set_budget(category, limit)
+        server = await FinanceAPIServer(tracker, host=host, port=0).start()
+        port = server.port
+        print(f"✓ Seeded ledger with {args.rows} transactions, server on {host}:{port}")
+
+    latencies = {}
+    errors = {}
+    requests_per_client = max(1, args.requests // args.concurrency)
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        client(host, port, requests_per_client, latencies, errors, random.Random(args.seed + index),
+               args.write_ratio, args.chart_ratio)
+        for index in range(args.concurrency)
+    ])
+    duration = time.perf_counter() - started
+
+    if server is not None:
+        await server.stop()
+    print_report(latencies, errors, duration)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the finance API server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=None,
+                        help="Port of a running server (default: start one in-process)")
+    parser.add_argument('--rows', type=int, default=100000, help="Size of the seeded ledger")
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    parser.add_argument('--chart-ratio', type=float, default=0.01)
+    parser.add_argument('--seed', type=int, default=0)
+    asyncio.run(run_load_test(parser.parse_args()))
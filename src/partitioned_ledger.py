@@ -0,0 +1,260 @@
+import csv
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+MANIFEST_FILE = 'manifest.json'
+SCHEMA_VERSION = 1
+PARTITION_STRIDE = 1 << 32
+
+
+def partition_row_ids(key, offsets):
+    """
+    Stable ids for rows at the given offsets of a 'YYYY-MM' partition. Ids never change once
+    a row is written and sort in partition-then-offset order, i.e. the order load() returns.
+    """
+    year, month = key.split('-')
+    return (int(year) * 12 + int(month) - 1) * PARTITION_STRIDE + np.asarray(offsets, dtype=np.int64)
+
+
+def row_id_partitions(row_ids):
+    """Split sorted row ids into (partition key, offsets) groups, one per partition"""
+    numbers, offsets = np.divmod(np.asarray(row_ids, dtype=np.int64), PARTITION_STRIDE)
+    boundaries = np.flatnonzero(numbers[1:] != numbers[:-1]) + 1
+    starts = np.concatenate(([0], boundaries)) if len(numbers) else boundaries
+    for number, group in zip(numbers[starts], np.split(offsets, boundaries)):
+        yield f"{number // 12:04d}-{number % 12 + 1:02d}", group
+
+
+class PartitionedLedger:
+    """
+    On-disk ledger with one CSV file per year-month plus a manifest of row counts and
+    min/max dates. Queries read only the partitions whose date range overlaps, and appends
+    touch only the partitions the new rows fall in. Partition files are append-only, so a
+    manifest copy taken at any point keeps describing a consistent prefix of every file.
+    """
+
+    def __init__(self, directory, max_cached_partitions=64):
+        self.directory = directory
+        self.max_cached_partitions = max_cached_partitions
+        self._lock = threading.RLock()
+        self._cache = OrderedDict()
+        os.makedirs(directory, exist_ok=True)
+
+        manifest_path = os.path.join(directory, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as manifest_file:
+                self.manifest = json.load(manifest_file)
+            if self.manifest.get('schema_version') != SCHEMA_VERSION:
+                raise ValueError(f"Unsupported ledger schema version: {self.manifest.get('schema_version')}")
+        else:
+            self.manifest = {'schema_version': SCHEMA_VERSION, 'columns': None, 'partitions': {}}
+
+    # ---- Manifest -------------------------------------------------------------
+
+    def partitions(self):
+        """Copy of the partition table: {key: {'file', 'rows', 'min_date', 'max_date'}}"""
+        with self._lock:
+            return {key: dict(info) for key, info in self.manifest['partitions'].items()}
+
+    def row_count(self, partitions=None):
+        partitions = self.partitions() if partitions is None else partitions
+        return sum(info['rows'] for info in partitions.values())
+
+    def _save_manifest(self):
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, prefix=MANIFEST_FILE, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w') as manifest_file:
+                json.dump(self.manifest, manifest_file, indent=2, sort_keys=True)
+            os.replace(temp_path, os.path.join(self.directory, MANIFEST_FILE))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def overlapping(partitions, start_date=None, end_date=None):
+        """Keys of the partitions whose [min_date, max_date] overlaps the requested range"""
+        keys = []
+        for key in sorted(partitions):
+            info = partitions[key]
+            if start_date is not None and pd.Timestamp(info['max_date']) < pd.Timestamp(start_date):
+                continue
+            if end_date is not None and pd.Timestamp(info['min_date']) > pd.Timestamp(end_date):
+                continue
+            keys.append(key)
+        return keys
+
+    # ---- Writes ---------------------------------------------------------------
+
+    def write(self, transactions):
+        """Replace the whole ledger with the given transactions"""
+        with self._lock:
+            for info in self.manifest['partitions'].values():
+                path = os.path.join(self.directory, info['file'])
+                if os.path.exists(path):
+                    os.remove(path)
+            self.manifest['partitions'] = {}
+            self.manifest['columns'] = list(transactions.columns)
+            self._cache.clear()
+            self.append(transactions)
+            self._save_manifest()
+
+    def append(self, transactions):
+        """
+        Append rows, writing only to the year-month partitions they belong to.
+        Returns the new rows' stable ids (see partition_row_ids), in input order.
+        Columns the ledger hasn't seen yet are added to its schema. The append is all or
+        nothing: if any write fails, every touched file is cut back to its previous size.
+        """
+        row_ids = np.empty(len(transactions), dtype=np.int64)
+        if len(transactions) == 0:
+            return row_ids
+
+        with self._lock:
+            previous_columns = self.manifest['columns']
+            previous_partitions = self.partitions()
+            columns = list(previous_columns or [])
+            columns += [column for column in transactions.columns if column not in columns]
+            transactions = transactions.reset_index(drop=True).reindex(columns=columns)
+            dates = pd.to_datetime(transactions['date'])
+
+            written = []
+            try:
+                groups = list(transactions.groupby([dates.dt.year, dates.dt.month], sort=True))
+                for (year, month), rows in groups:
+                    key = f"{year:04d}-{month:02d}"
+                    info = previous_partitions.get(key)
+                    path = os.path.join(self.directory, f"{key}.csv")
+                    if info is None or info['rows'] == 0:
+                        written.append((path, None))
+                        rows.to_csv(path, mode='w', header=True, index=False)
+                        continue
+
+                    if self._file_columns(path) != columns:
+                        self._rewrite_columns(path, columns)
+                    written.append((path, os.path.getsize(path)))
+                    rows.to_csv(path, mode='a', header=False, index=False)
+
+                for (year, month), rows in groups:
+                    key = f"{year:04d}-{month:02d}"
+                    info = self.manifest['partitions'].setdefault(
+                        key, {'file': f"{key}.csv", 'rows': 0, 'min_date': None, 'max_date': None})
+                    row_ids[rows.index.to_numpy()] = partition_row_ids(key, info['rows'] + np.arange(len(rows)))
+
+                    row_dates = pd.to_datetime(rows['date'])
+                    min_date, max_date = row_dates.min(), row_dates.max()
+                    if info['min_date'] is not None:
+                        min_date = min(min_date, pd.Timestamp(info['min_date']))
+                        max_date = max(max_date, pd.Timestamp(info['max_date']))
+                    info['rows'] += len(rows)
+                    info['min_date'] = min_date.isoformat()
+                    info['max_date'] = max_date.isoformat()
+                self.manifest['columns'] = columns
+                self._save_manifest()
+            except BaseException:
+                for path, size in written:
+                    if size is None:
+                        if os.path.exists(path):
+                            os.remove(path)
+                    else:
+                        os.truncate(path, size)
+                self.manifest['columns'] = previous_columns
+                self.manifest['partitions'] = previous_partitions
+                raise
+
+            if previous_columns is not None and columns != previous_columns:
+                # Cached frames were read with the old schema
+                self._cache.clear()
+        return row_ids
+
+    @staticmethod
+    def _file_columns(path):
+        with open(path, newline='') as partition_file:
+            return next(csv.reader(partition_file), [])
+
+    def _rewrite_columns(self, path, columns):
+        """Atomically rewrite a partition file with the given (wider) header, leaving new columns empty"""
+        frame = pd.read_csv(path, dtype=str, keep_default_na=False).reindex(columns=columns, fill_value='')
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w', newline='') as temp_file:
+                frame.to_csv(temp_file, index=False)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    # ---- Reads ----------------------------------------------------------------
+
+    def load_partition(self, key, rows):
+        """Read the first `rows` rows of one partition, served from the cache when possible"""
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and len(cached) >= rows:
+                self._cache.move_to_end(key)
+                return cached.iloc[:rows]
+            columns = self.manifest['columns']
+
+        path = os.path.join(self.directory, f"{key}.csv")
+        frame = pd.read_csv(path, nrows=rows, parse_dates=['date'])
+        frame = frame.reindex(columns=columns)
+        frame['date'] = frame['date'].astype('datetime64[ns]')
+        frame['amount'] = frame['amount'].astype(float)
+
+        with self._lock:
+            self._cache[key] = frame
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cached_partitions:
+                self._cache.popitem(last=False)
+        return frame
+
+    def load(self, start_date=None, end_date=None, partitions=None):
+        """
+        Load rows in [start_date, end_date] from the overlapping partitions only.
+        Pass a partitions table from partitions() to read a consistent earlier state.
+        """
+        partitions = self.partitions() if partitions is None else partitions
+        keys = self.overlapping(partitions, start_date, end_date)
+        frames = [self.load_partition(key, partitions[key]['rows']) for key in keys]
+        if not frames:
+            return None
+
+        transactions = pd.concat(frames, ignore_index=True)
+        mask = pd.Series(True, index=transactions.index)
+        if start_date is not None:
+            mask &= transactions['date'] >= pd.Timestamp(start_date)
+        if end_date is not None:
+            mask &= transactions['date'] <= pd.Timestamp(end_date)
+        return transactions if mask.all() else transactions[mask].reset_index(drop=True)
+
+    def row_ids(self, partitions=None):
+        """Stable ids of every row, in the order load() returns them"""
+        partitions = self.partitions() if partitions is None else partitions
+        ids = [partition_row_ids(key, np.arange(partitions[key]['rows'])) for key in sorted(partitions)]
+        return np.concatenate(ids) if ids else np.empty(0, dtype=np.int64)
+
+    def load_rows(self, row_ids, start_date=None, end_date=None, partitions=None):
+        """
+        Load the rows with the given sorted ids, reading only their partitions (and only those
+        overlapping [start_date, end_date]; callers still apply their own date filter). Ids the
+        partitions table doesn't cover yet, i.e. rows written after it was taken, are skipped.
+        """
+        partitions = self.partitions() if partitions is None else partitions
+        wanted = set(self.overlapping(partitions, start_date, end_date))
+
+        frames = []
+        for key, offsets in row_id_partitions(row_ids):
+            if key not in wanted:
+                continue
+            rows = partitions[key]['rows']
+            offsets = offsets[offsets < rows]
+            if len(offsets):
+                frames.append(self.load_partition(key, rows).iloc[offsets])
+        if not frames:
+            return None
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,169 @@
+import re
+import threading
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Split a description into lowercase alphanumeric tokens"""
+    if not isinstance(text, str):
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def merge_rows(existing, rows):
+    """Merge sorted new row ids into a sorted posting array"""
+    if existing is None:
+        return rows
+    if len(existing) == 0 or existing[-1] < rows[0]:
+        return np.concatenate((existing, rows))
+    return np.insert(existing, np.searchsorted(existing, rows), rows)
+
+
+class DescriptionIndex:
+    """
+    Inverted index mapping description tokens to sorted row ids. Ids default to row positions;
+    callers with stable ids of their own (like ledger row ids) pass them explicitly.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.postings = {}
+        self._pending = {}
+        self._vocabulary = None
+        self.size = 0
+
+    def add(self, row_id, description):
+        """Index a single newly appended row (ignored unless it directly follows the indexed rows)"""
+        with self._lock:
+            if row_id != self.size:
+                # The index is missing earlier rows and has to be rebuilt anyway
+                return
+            for token in set(tokenize(description)):
+                self._pending.setdefault(token, []).append(row_id)
+                if token not in self.postings:
+                    self._vocabulary = None
+            self.size += 1
+
+    def rebuild(self, descriptions, row_ids=None):
+        """Rebuild the whole index from a Series of descriptions in row order"""
+        with self._lock:
+            self.postings = {}
+            self._pending = {}
+            self._vocabulary = None
+            self.size = 0
+            self.extend(descriptions, row_ids)
+
+    def extend(self, descriptions, row_ids=None):
+        """Index a batch of rows appended after the current last row, or with the given ids"""
+        tokens = descriptions.fillna('').astype(str).str.lower().str.findall(TOKEN_PATTERN)
+        exploded = tokens.reset_index(drop=True).explode().dropna()
+        rows = exploded.index.to_numpy(dtype=np.int64)
+        if row_ids is not None:
+            rows = np.asarray(row_ids, dtype=np.int64)[rows]
+
+        frame = pd.DataFrame({'token': exploded.values, 'row': rows})
+        frame = frame.drop_duplicates().sort_values(['token', 'row'], kind='stable')
+        tokens_sorted = frame['token'].to_numpy()
+        rows_sorted = frame['row'].to_numpy(dtype=np.int64)
+
+        with self._lock:
+            if row_ids is None:
+                rows_sorted = rows_sorted + self.size
+            self.size += len(descriptions)
+            if len(frame) == 0:
+                return
+
+            self._flush()
+            self._vocabulary = None
+
+            # Split the sorted row array wherever the token changes
+            boundaries = np.flatnonzero(tokens_sorted[1:] != tokens_sorted[:-1]) + 1
+            starts = np.concatenate(([0], boundaries))
+            for start, rows in zip(starts, np.split(rows_sorted, boundaries)):
+                token = tokens_sorted[start]
+                self.postings[token] = merge_rows(self.postings.get(token), rows)
+
+    def state(self):
+        """Posting arrays and row count, for persisting the index"""
+        with self._lock:
+            self._flush()
+            return {'postings': dict(self.postings), 'size': self.size}
+
+    def load_state(self, state):
+        """Replace the index with a state previously returned by state()"""
+        with self._lock:
+            self.postings = dict(state['postings'])
+            self._pending = {}
+            self._vocabulary = None
+            self.size = state['size']
+
+    def _flush(self):
+        """Merge rows added since the last query into the posting arrays"""
+        with self._lock:
+            if not self._pending:
+                return
+            for token, rows in self._pending.items():
+                self.postings[token] = merge_rows(self.postings.get(token), np.asarray(rows, dtype=np.int64))
+            self._pending = {}
+
+    def vocabulary(self):
+        """Sorted list of all indexed tokens"""
+        with self._lock:
+            self._flush()
+            if self._vocabulary is None:
+                self._vocabulary = sorted(self.postings)
+            return self._vocabulary
+
+    def lookup(self, term, prefix=False):
+        """Return the sorted row ids containing a term (or any term with that prefix)"""
+        self._flush()
+        term = term.lower()
+        if not prefix:
+            return self.postings.get(term, np.empty(0, dtype=np.int64))
+
+        vocabulary = self.vocabulary()
+        matches = []
+        position = bisect_left(vocabulary, term)
+        while position < len(vocabulary) and vocabulary[position].startswith(term):
+            matches.append(self.postings[vocabulary[position]])
+            position += 1
+
+        if not matches:
+            return np.empty(0, dtype=np.int64)
+        if len(matches) == 1:
+            return matches[0]
+        return np.unique(np.concatenate(matches))
+
+    def query(self, text, mode='and', prefix=False):
+        """
+        Return sorted row ids matching all ('and') or any ('or') query terms.
+        A term ending in '*' is always treated as a prefix.
+        """
+        if mode not in ['and', 'or']:
+            raise ValueError("Search mode must be 'and' or 'or'")
+
+        terms = []
+        for raw in text.split():
+            is_prefix = prefix or raw.endswith('*')
+            terms.extend((token, is_prefix) for token in tokenize(raw))
+
+        if not terms:
+            return np.empty(0, dtype=np.int64)
+
+        # Intersect the shortest posting lists first
+        postings = [self.lookup(token, is_prefix) for token, is_prefix in terms]
+        if mode == 'and':
+            postings.sort(key=len)
+            result = postings[0]
+            for rows in postings[1:]:
+                if len(result) == 0:
+                    break
+                result = np.intersect1d(result, rows, assume_unique=True)
+            return result
+
+        return np.unique(np.concatenate(postings))
@@ -5,12 +5,64 @@ def export_to_csv(tracker, filename='finance_data.csv'):
     tracker.transactions.to_csv(filename, index=False)
     print(f"✓ Data exported to {filename}")
 
-def import_from_csv(tracker, filename):
-    """Import transactions from CSV"""
+def import_from_csv(tracker, filename, categorizer=None, duplicates='drop'):
+    """
+    Import transactions from CSV.
+    If a TransactionCategorizer is given, rows without a category are categorized by its rules.
+    Rows already in the tracker are dropped ('drop'), marked in a 'duplicate' column ('flag'),
+    or imported anyway ('keep').
+    """
+    if duplicates not in ['drop', 'flag', 'keep']:
+        raise ValueError("duplicates must be 'drop', 'flag' or 'keep'")
+
     try:
-        imported_data = pd.read_csv(filename)
-        tracker.transactions = pd.concat([tracker.transactions, imported_data], ignore_index=True)
-        tracker.transactions['date'] = pd.to_datetime(tracker.transactions['date'])
+        imported_data = read_transactions_csv(filename)
+        import_transactions(tracker, imported_data, categorizer, duplicates)
+        if tracker.ledger is not None:
+            # Keep the warm-start cache current for short-lived report workers
+            tracker.save_warm_cache()
         print(f"✓ Data imported from {filename}")
     except Exception as e:
-        print(f"Error importing data: {e}")
\ No newline at end of file
+        print(f"Error importing data: {e}")
+
+def read_transactions_csv(filename):
+    """Read a transactions CSV (a path or an open file) with parsed dates"""
+    imported_data = pd.read_csv(filename)
+    imported_data['date'] = pd.to_datetime(imported_data['date'])
+    return imported_data
+
+def import_transactions(tracker, imported_data, categorizer=None, duplicates='drop'):
+    """
+    Add an already-read frame of transactions the same way import_from_csv does, but let
+    errors propagate. Returns the number of transactions added.
+    """
+    if duplicates not in ['drop', 'flag', 'keep']:
+        raise ValueError("duplicates must be 'drop', 'flag' or 'keep'")
+
+    # Apply add_transactions' payment method default first, so re-imports fingerprint the same
+    payment_methods = imported_data['payment_method'] if 'payment_method' in imported_data else None
+    imported_data = imported_data.assign(payment_method=pd.Series(payment_methods, index=imported_data.index,
+                                                                  dtype=object).fillna('Cash'))
+
+    if duplicates != 'keep':
+        is_duplicate = tracker.find_duplicates(imported_data)
+        if is_duplicate.any():
+            if duplicates == 'drop':
+                imported_data = imported_data[~is_duplicate]
+                print(f"✓ Skipped {is_duplicate.sum()} duplicate transactions")
+            else:
+                print(f"⚠️  Flagged {is_duplicate.sum()} duplicate transactions")
+        if duplicates == 'flag':
+            imported_data['duplicate'] = is_duplicate
+
+    if categorizer is not None:
+        if 'category' not in imported_data:
+            imported_data['category'] = None
+        uncategorized = imported_data['category'].isna()
+        if uncategorized.any():
+            imported_data.loc[uncategorized, 'category'] = \
+                categorizer.categorize(imported_data[uncategorized])
+            categorized = uncategorized.sum() - imported_data['category'].isna().sum()
+            print(f"✓ Auto-categorized {categorized} of {uncategorized.sum()} uncategorized rows")
+
+    return tracker.add_transactions(imported_data)
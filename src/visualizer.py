@@ -1,68 +1,116 @@
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+import seaborn as sns
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from .currency import currency_symbol
+    from .downsampling import GRANULARITY_LABELS, aggregate_by_period, choose_granularity, downsample, point_budget
+except ImportError:
+    from currency import currency_symbol
+    from downsampling import GRANULARITY_LABELS, aggregate_by_period, choose_granularity, downsample, point_budget
+
+PERIOD_NAMES = {'D': 'Day', 'W': 'Week', 'M': 'Month', 'Q': 'Quarter', 'Y': 'Year'}
+
+# Chart name -> (FinanceVisualizer method, accepted keyword arguments and their types)
+CHARTS = {
+    'income-vs-expenses': ('plot_income_vs_expenses', {'months': int}),
+    'expense-categories': ('plot_expense_categories', {'month': int, 'year': int}),
+    'spending-trends': ('plot_spending_trends', {'category': str}),
+    'budget-vs-actual': ('plot_budget_vs_actual', {'month': int, 'year': int}),
+}
+
+# Set style for better visualizations
+plt.style.use('seaborn-v0_8-darkgrid')
+sns.set_palette("husl")
+
 class FinanceVisualizer:
     @staticmethod
-    def plot_income_vs_expenses(tracker, months=3):
-        """Plot income vs expenses over time"""
-        if len(tracker.transactions) == 0:
+    def plot_income_vs_expenses(tracker, months=3, show=True, width_px=None):
+        """
+        Plot income vs expenses over time (returns the figure; show=False skips plt.show()).
+        If the last N months don't fit the chart width they are regrouped into quarters or years.
+        """
+        tracker = tracker.snapshot()
+        if tracker.row_count == 0:
             print("No data to visualize")
             return
 
-        # Prepare data
-        df = tracker.transactions.copy()
-        df['month'] = df['date'].dt.to_period('M')
-        monthly_data = df.groupby(['month', 'type'])['amount'].sum().unstack().fillna(0)
+        # Prepare data (a partitioned ledger reads only the partitions of the last N months)
+        _, latest = tracker.date_range()
+        window_start = (latest.to_period('M') - (months - 1)).start_time if months else None
+        df = tracker.transactions_between(window_start)
+        monthly_data = df.groupby([df['date'].dt.to_period('M'), 'type'])['amount'].sum().unstack().fillna(0)
 
         # Get last N months
         monthly_data = monthly_data.tail(months)
 
-        # Plot
-        fig, ax = plt.subplots(2, 1, figsize=(12, 8))
+        figsize = (12, 8)
+        width_px = width_px or figsize[0] * plt.rcParams['figure.dpi']
+        granularity = 'M'
+        max_bars = point_budget(width_px, pixels_per_point=12)
+        if len(monthly_data) > max_bars:
+            granularity = choose_granularity(monthly_data.index[0].start_time, monthly_data.index[-1].end_time,
+                                             max_bars, finest='Q')
+            monthly_data = monthly_data.groupby(monthly_data.index.asfreq(granularity)).sum()
+        label = GRANULARITY_LABELS[granularity]
+        symbol = currency_symbol(tracker.reporting_currency)
+
+        # Plot on integer positions and label only as many ticks as fit
+        x = np.arange(len(monthly_data))
+        tick_step = max(1, int(np.ceil(len(monthly_data) / max(1, width_px // 60))))
+        tick_labels = [str(period) for period in monthly_data.index[::tick_step]]
+        marker = 'o' if len(monthly_data) <= 60 else None
+
+        fig, ax = plt.subplots(2, 1, figsize=figsize)
 
         # Bar plot
-        monthly_data[['income', 'expense']].plot(kind='bar', ax=ax[0])
-        ax[0].set_title('Monthly Income vs Expenses')
-        ax[0].set_ylabel('Amount ($)')
-        ax[0].legend(['Income', 'Expenses'])
-        ax[0].tick_params(axis='x', rotation=45)
+        bar_width = 0.4
+        ax[0].bar(x - bar_width / 2, monthly_data.get('income', 0), bar_width, label='Income')
+        ax[0].bar(x + bar_width / 2, monthly_data.get('expense', 0), bar_width, label='Expenses')
+        ax[0].set_title(f'{label} Income vs Expenses')
+        ax[0].set_ylabel(f'Amount ({symbol})')
+        ax[0].legend()
 
         # Line plot for net savings
-        monthly_data['net'] = monthly_data.get('income', 0) - monthly_data.get('expense', 0)
-        monthly_data['net'].plot(kind='line', marker='o', ax=ax[1], color='green')
-        ax[1].set_title('Monthly Net Savings')
-        ax[1].set_ylabel('Net Savings ($)')
+        net = monthly_data.get('income', 0) - monthly_data.get('expense', 0)
+        net = pd.Series(net, index=monthly_data.index, dtype=float)
+        ax[1].plot(x, net.values, marker=marker, color='green')
+        ax[1].set_title(f'{label} Net Savings')
+        ax[1].set_ylabel(f'Net Savings ({symbol})')
         ax[1].axhline(y=0, color='r', linestyle='--', alpha=0.5)
-        ax[1].fill_between(range(len(monthly_data)),
-                           monthly_data['net'],
-                           where=(monthly_data['net'] > 0),
-                           color='green', alpha=0.3)
-        ax[1].fill_between(range(len(monthly_data)),
-                           monthly_data['net'],
-                           where=(monthly_data['net'] < 0),
-                           color='red', alpha=0.3)
-        ax[1].tick_params(axis='x', rotation=45)
-        ax[1].set_xticks(range(len(monthly_data)))
-        ax[1].set_xticklabels([str(m) for m in monthly_data.index])
+        ax[1].fill_between(x, net.values, where=(net.values > 0), color='green', alpha=0.3)
+        ax[1].fill_between(x, net.values, where=(net.values < 0), color='red', alpha=0.3)
+
+        for axis in ax:
+            axis.set_xticks(x[::tick_step])
+            axis.set_xticklabels(tick_labels)
+            axis.tick_params(axis='x', rotation=45)
 
         plt.tight_layout()
-        plt.show()
+        if show:
+            plt.show()
+        return fig
 
     @staticmethod
-    def plot_expense_categories(tracker, month=None, year=None):
+    def plot_expense_categories(tracker, month=None, year=None, show=True):
         """Visualize expense distribution by category"""
-        if len(tracker.transactions) == 0:
+        tracker = tracker.snapshot()
+        if tracker.row_count == 0:
             print("No data to visualize")
             return
 
         # Filter by month if specified
-        df = tracker.transactions.copy()
         if month and year:
+            start_date = pd.Timestamp(year=year, month=month, day=1)
+            df = tracker.transactions_between(start_date, start_date + pd.offsets.MonthEnd(0))
             df = df[(df['date'].dt.month == month) & (df['date'].dt.year == year)]
+        else:
+            df = tracker.report_transactions
 
         expenses = df[df['type'] == 'expense']
 
@@ -85,74 +133,88 @@ class FinanceVisualizer:
         # Bar chart (sorted)
         expense_by_cat.sort_values(ascending=False).plot(kind='bar', ax=axes[1])
         axes[1].set_title('Expenses by Category')
-        axes[1].set_ylabel('Amount ($)')
+        axes[1].set_ylabel(f'Amount ({currency_symbol(tracker.reporting_currency)})')
         axes[1].tick_params(axis='x', rotation=45)
 
         plt.tight_layout()
-        plt.show()
+        if show:
+            plt.show()
+        return fig
 
     @staticmethod
-    def plot_spending_trends(tracker, category=None):
-        """Plot spending trends over time"""
-        if len(tracker.transactions) == 0:
+    def plot_spending_trends(tracker, category=None, show=True, granularity='auto', width_px=None,
+                             method='lttb'):
+        """
+        Plot spending trends over time.
+        granularity is 'D', 'W', 'M', 'Q', 'Y' or 'auto' (monthly, coarsened to fit the chart width);
+        series that still have more points than the width can show are downsampled with
+        method ('lttb' or 'minmax') so render time stays flat as the ledger grows.
+        """
+        tracker = tracker.snapshot()
+        if tracker.row_count == 0:
             print("No data to visualize")
             return
 
-        df = tracker.transactions.copy()
+        df = tracker.report_transactions
         expenses = df[df['type'] == 'expense']
 
         if len(expenses) == 0:
             print("No expense data")
             return
 
-        # Convert amount to float and handle any conversion errors
-        expenses['amount'] = expenses['amount'].astype(float)
-
-        # Group by month and optionally category
-        expenses['month'] = expenses['date'].dt.to_period('M')
-
         if category:
-            category_expenses = expenses[expenses['category'] == category]
-            if len(category_expenses) == 0:
+            expenses = expenses[expenses['category'] == category]
+            if len(expenses) == 0:
                 print(f"No data for category: {category}")
                 return
-            monthly_trend = category_expenses.groupby('month')['amount'].sum()
-            title = f'Monthly Spending Trend: {category}'
-        else:
-            monthly_trend = expenses.groupby('month')['amount'].sum()
-            title = 'Total Monthly Spending Trend'
 
-        # Convert Period index to string for plotting
-        months_str = [str(m) for m in monthly_trend.index]
+        figsize = (12, 6)
+        width_px = width_px or figsize[0] * plt.rcParams['figure.dpi']
+        max_points = point_budget(width_px)
+        if granularity == 'auto':
+            granularity = choose_granularity(expenses['date'].min(), expenses['date'].max(), max_points)
+        elif granularity not in GRANULARITY_LABELS:
+            raise ValueError(f"Granularity must be 'auto' or one of {', '.join(GRANULARITY_LABELS)}")
+
+        # Aggregate per period, then thin out whatever the chart width cannot show
+        trend = aggregate_by_period(expenses['date'], expenses['amount'].astype(float), granularity)
+        plotted = downsample(trend, max_points, method)
+
+        label = GRANULARITY_LABELS[granularity]
+        title = f'{label} Spending Trend: {category}' if category else f'Total {label} Spending Trend'
 
         # Plot
-        plt.figure(figsize=(12, 6))
-        plt.plot(months_str, monthly_trend.values, marker='o', linewidth=2)
+        fig = plt.figure(figsize=figsize)
+        plt.plot(plotted.index, plotted.values, marker='o' if len(plotted) <= 60 else None, linewidth=2)
         plt.title(title)
-        plt.xlabel('Month')
-        plt.ylabel('Amount ($)')
+        plt.xlabel(PERIOD_NAMES[granularity])
+        plt.ylabel(f'Amount ({currency_symbol(tracker.reporting_currency)})')
         plt.grid(True, alpha=0.3)
         plt.xticks(rotation=45)
 
-        # Add trend line if we have enough points
-        if len(monthly_trend) >= 2:
+        # Add trend line (fitted on every period, not just the plotted ones) if we have enough points
+        if len(trend) >= 2:
             try:
-                x = np.arange(len(monthly_trend))
-                y = monthly_trend.values.astype(float)
+                x = mdates.date2num(trend.index)
+                y = trend.values.astype(float)
                 if not np.any(np.isnan(y)):  # Check for NaN values
                     z = np.polyfit(x, y, 1)
                     p = np.poly1d(z)
-                    plt.plot(x, p(x), "r--", alpha=0.5, label='Trend Line')
+                    ends = x[[0, -1]]
+                    plt.plot(trend.index[[0, -1]], p(ends), "r--", alpha=0.5, label='Trend Line')
                     plt.legend()
             except Exception as e:
                 print(f"Note: Could not calculate trend line: {e}")
 
         plt.tight_layout()
-        plt.show()
+        if show:
+            plt.show()
+        return fig
 
     @staticmethod
-    def plot_budget_vs_actual(tracker, month=None, year=None):
+    def plot_budget_vs_actual(tracker, month=None, year=None, show=True):
         """Compare budget vs actual spending"""
+        tracker = tracker.snapshot()
         if not tracker.budget_limits:
             print("No budgets set")
             return
@@ -169,10 +231,11 @@ class FinanceVisualizer:
         else:
             end_date = pd.Timestamp(year=year, month=month+1, day=1) - timedelta(days=1)
 
-        monthly_expenses = tracker.transactions[
-            (tracker.transactions['date'] >= start_date) &
-            (tracker.transactions['date'] <= end_date) &
-            (tracker.transactions['type'] == 'expense')
+        transactions = tracker.transactions_between(start_date, end_date)
+        monthly_expenses = transactions[
+            (transactions['date'] >= start_date) &
+            (transactions['date'] <= end_date) &
+            (transactions['type'] == 'expense')
             ]
 
         actual_by_category = monthly_expenses.groupby('category')['amount'].sum()
@@ -193,20 +256,22 @@ class FinanceVisualizer:
         x = np.arange(len(categories))
         width = 0.35
 
-        plt.figure(figsize=(12, 6))
+        fig = plt.figure(figsize=(12, 6))
         plt.bar(x - width/2, plot_data['Budget'], width, label='Budget', color='lightblue')
         plt.bar(x + width/2, plot_data['Actual'], width, label='Actual', color='salmon')
 
         # Highlight over-budget categories
         for i, (budget, actual) in enumerate(zip(budget_values, actual_values)):
             if actual > budget:
-                plt.text(i, actual, f"+${actual-budget:.0f}",
+                plt.text(i, actual, f"+{currency_symbol(tracker.reporting_currency)}{actual-budget:.0f}",
                          ha='center', va='bottom', color='red', fontweight='bold')
 
         plt.xlabel('Category')
-        plt.ylabel('Amount ($)')
+        plt.ylabel(f'Amount ({currency_symbol(tracker.reporting_currency)})')
         plt.title(f'Budget vs Actual Spending - {month}/{year}')
         plt.xticks(x, categories, rotation=45)
         plt.legend()
         plt.tight_layout()
-        plt.show()
\ No newline at end of file
+        if show:
+            plt.show()
+        return fig
\ No newline at end of file
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .fingerprint_index import fingerprint_transactions
+    from .search_index import DescriptionIndex
+except ImportError:
+    from fingerprint_index import fingerprint_transactions
+    from search_index import DescriptionIndex
+
+CACHE_FILE = 'derived_cache.pkl'
+CACHE_SCHEMA_VERSION = 3
+
+TOTALS_KEYS = ['date', 'type', 'category', 'currency']
+
+
+def content_fingerprint(ledger, partitions=None):
+    """
+    Hash of a ledger's columns, partition table and each partition file's size and modification
+    time, so an edit that keeps a file's length still invalidates the cache
+    """
+    partitions = ledger.partitions() if partitions is None else partitions
+    stats = {}
+    for key, info in partitions.items():
+        path = os.path.join(ledger.directory, info['file'])
+        try:
+            stat = os.stat(path)
+            stats[key] = [stat.st_size, stat.st_mtime_ns]
+        except FileNotFoundError:
+            stats[key] = None
+    content = {'columns': ledger.manifest['columns'], 'partitions': partitions, 'stats': stats}
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+def aggregate_totals(transactions):
+    """
+    Sum amounts and count rows per (date, type, category, currency). FX conversion is linear
+    per date and currency, so every report can be computed exactly from these totals.
+    """
+    grouped = transactions.groupby(TOTALS_KEYS, sort=False, dropna=False)['amount'].agg(['sum', 'size'])
+    totals = grouped.reset_index().rename(columns={'sum': 'amount', 'size': 'count'})
+    totals['date'] = totals['date'].astype('datetime64[ns]')
+    return totals.sort_values('date', kind='stable').reset_index(drop=True)
+
+
+def merge_totals(totals, new_totals):
+    """Fold the totals of newly appended rows into existing totals"""
+    combined = pd.concat([totals, new_totals], ignore_index=True)
+    grouped = combined.groupby(TOTALS_KEYS, sort=False, dropna=False)[['amount', 'count']].sum()
+    return grouped.reset_index().sort_values('date', kind='stable').reset_index(drop=True)
+
+
+def build_derived(transactions, row_ids=None):
+    """Compute every cached structure from scratch for the given transactions (and their ledger row ids)"""
+    index = DescriptionIndex()
+    index.rebuild(transactions['description'], row_ids)
+    return {
+        'totals': aggregate_totals(transactions),
+        'fingerprints': np.sort(fingerprint_transactions(transactions)),
+        'description_index': index.state()
+    }
+
+
+class WarmCache:
+    """
+    Derived structures (per-day totals, duplicate fingerprints, description postings) saved
+    next to a ledger, tagged with the ledger's content fingerprint and a schema version.
+    A cache that is missing, unreadable, from another schema or for other content is ignored.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, CACHE_FILE)
+
+    def load(self, fingerprint):
+        """Return the cached structures, or None when they can't be trusted for this fingerprint"""
+        try:
+            with open(self.path, 'rb') as cache_file:
+                cached = pickle.load(cache_file)
+        except Exception:
+            return None
+        if not isinstance(cached, dict) or cached.get('schema_version') != CACHE_SCHEMA_VERSION \
+                or cached.get('fingerprint') != fingerprint:
+            return None
+        return cached['derived']
+
+    def save(self, fingerprint, derived):
+        cached = {'schema_version': CACHE_SCHEMA_VERSION, 'fingerprint': fingerprint, 'derived': derived}
+        # Workers may save concurrently, so each writes its own temp file and swaps it in whole
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, prefix=CACHE_FILE, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as cache_file:
+                pickle.dump(cached, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
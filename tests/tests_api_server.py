@@ -0,0 +1,104 @@
+import asyncio
+import json
+import pytest
+import matplotlib
+matplotlib.use('Agg')
+from src.api_server import FinanceAPIServer
+from src.finance_tracker import PersonalFinanceTracker, build_transaction_frame
+
+async def request(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    writer.write((f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+                  f"Connection: close\r\n\r\n").encode('latin-1') + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b'\r\n\r\n')
+    status = int(head.split()[1])
+    return status, (json.loads(content) if b'application/json' in head else content)
+
+class TestAPIServer:
+    def run(self, scenario):
+        async def wrapper():
+            server = await FinanceAPIServer(PersonalFinanceTracker(), port=0).start()
+            try:
+                return await scenario(server.port)
+            finally:
+                await server.stop()
+        return asyncio.run(wrapper())
+
+    def test_add_and_summary(self):
+        async def scenario(port):
+            transaction = {'date': '2024-01-01', 'type': 'income', 'category': 'Salary',
+                           'description': 'Salary', 'amount': 3000}
+            expenses = [{'date': '2024-01-0%d' % day, 'type': 'expense', 'category': 'Food',
+                         'description': 'Groceries', 'amount': 50} for day in range(2, 6)]
+            results = await asyncio.gather(request(port, 'POST', '/transactions', transaction),
+                                           request(port, 'POST', '/transactions/bulk', expenses))
+            assert [status for status, _ in results] == [201, 201]
+            return await request(port, 'GET', '/summary?start_date=2024-01-01')
+
+        status, body = self.run(scenario)
+        assert status == 200
+        assert body['summary']['total_income'] == 3000
+        assert body['summary']['total_expenses'] == 200
+
+    def test_budget_alerts_and_chart(self):
+        async def scenario(port):
+            await request(port, 'POST', '/budgets', {'category': 'Food', 'limit': 100})
+            await request(port, 'POST', '/transactions', {'date': '2024-03-02', 'type': 'expense',
+                                                          'category': 'Food', 'description': 'Dinner',
+                                                          'amount': 150})
+            alerts = await request(port, 'GET', '/alerts?month=3&year=2024')
+            chart = await request(port, 'GET', '/charts/expense-categories?month=3&year=2024')
+            return alerts, chart
+
+        (alert_status, alerts), (chart_status, chart) = self.run(scenario)
+        assert alert_status == 200 and alerts['alerts'][0]['over_by'] == 50
+        assert chart_status == 200 and chart.startswith(b'\x89PNG')
+
+    def test_invalid_requests(self):
+        async def scenario(port):
+            return (await request(port, 'POST', '/transactions', {'type': 'refund'}),
+                    await request(port, 'GET', '/nope'),
+                    await request(port, 'POST', '/transactions', {'date': '2024-01-01', 'type': 'expense',
+                                                                  'category': 'Food', 'description': 'Sushi',
+                                                                  'amount': 900, 'currency': 'JPY'}),
+                    await request(port, 'GET', '/summary'))
+
+        (bad_status, _), (missing_status, _), (currency_status, _), (summary_status, _) = self.run(scenario)
+        assert bad_status == 400
+        assert missing_status == 404
+        assert currency_status == 400
+        assert summary_status == 200
+
+    def test_invalid_content_length(self):
+        async def raw(port, length):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(f"POST /budgets HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode('latin-1'))
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return int(response.split()[1])
+
+        async def scenario(port):
+            return [await raw(port, length) for length in ['abc', '-5', '\xb2']]
+
+        assert self.run(scenario) == [400, 400, 400]
+
+    def test_failed_append_does_not_fail_budgets(self):
+        tracker = PersonalFinanceTracker()
+        server = FinanceAPIServer(tracker)
+        tracker.add_transactions = lambda transactions: 1 / 0
+        frame = build_transaction_frame([{'date': '2024-01-01', 'type': 'expense', 'category': 'Food',
+                                          'description': 'Lunch', 'amount': 12}])
+        results = server._apply_writes([('transactions', frame, None), ('budget', ('Food', 100.0, 'USD'), None)])
+        assert isinstance(results[0], ZeroDivisionError)
+        assert results[1] == 100.0
+        assert tracker.snapshot().budget_limits == {'Food': 100.0}
+        server.read_executor.shutdown()
+        server.write_executor.shutdown()
+
+if __name__ == '__main__':
+    pytest.main()
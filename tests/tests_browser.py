@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+from src.browser import TransactionBrowser
+from src.finance_tracker import PersonalFinanceTracker
+
+class TestTransactionBrowser:
+    def setup_method(self):
+        tracker = PersonalFinanceTracker()
+        dates = pd.date_range('2024-01-01', periods=50, freq='D')
+        tracker.add_transactions(pd.DataFrame({
+            'date': dates,
+            'type': ['income' if day % 10 == 0 else 'expense' for day in range(50)],
+            'category': ['Salary' if day % 10 == 0 else ('Food' if day % 2 else 'Shopping') for day in range(50)],
+            'description': [f'Item {day}' for day in range(50)],
+            'amount': [float(day) for day in range(50)]
+        }))
+        self.browser = TransactionBrowser(tracker.transactions, page_size=10)
+
+    def test_paging(self):
+        assert self.browser.page_count == 5
+        assert list(self.browser.current_page()['amount']) == [float(day) for day in range(10)]
+        self.browser.next_page()
+        assert self.browser.current_page()['amount'].iloc[0] == 10
+        self.browser.go_to_page(99)
+        assert self.browser.page == 4
+        assert self.browser.render().startswith('Page 5/5 (50 transactions)')
+
+    def test_filter_and_sort(self):
+        self.browser.set_filter('expense', 'food')
+        assert len(self.browser.rows) == 25
+        self.browser.sort_by('amount', ascending=False)
+        assert self.browser.current_page()['amount'].iloc[0] == 49
+        assert set(self.browser.current_page()['category']) == {'Food'}
+
+    def test_sort_with_missing_category_and_ties(self):
+        transactions = pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=4, freq='D'),
+            'type': ['expense'] * 4,
+            'category': ['Food', None, 'Food', 'Bills'],
+            'amount': [5.0, 5.0, 7.0, 5.0]
+        })
+        browser = TransactionBrowser(transactions, page_size=10)
+        browser.sort_by('category')
+        assert list(browser.rows) == [3, 0, 2, 1]
+        browser.sort_by('category', ascending=False)
+        assert list(browser.rows) == [0, 2, 3, 1]
+        browser.sort_by('amount', ascending=False)
+        assert list(browser.rows) == [2, 0, 1, 3]
+        browser.set_filter(category='food')
+        assert list(browser.rows) == [2, 0]
+
+    def test_seek_date(self):
+        assert self.browser.seek_date('2024-01-25')
+        assert self.browser.page == 2
+        self.browser.sort_by('date', ascending=False)
+        assert self.browser.seek_date('2024-01-05')
+        assert self.browser.current_page()['date'].min() <= pd.Timestamp('2024-01-05')
+        assert not self.browser.seek_date('2023-01-01')
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,114 @@
+import random
+import re
+
+import pandas as pd
+import pytest
+from src.categorizer import TransactionCategorizer
+from src.finance_tracker import PersonalFinanceTracker
+from src.utils import import_from_csv
+
+class TestCategorizer:
+    def setup_method(self):
+        self.categorizer = TransactionCategorizer()
+        self.categorizer.add_merchant('Amazon', ['AMZN MKTP', 'AMAZON.COM'], 'Shopping')
+        self.categorizer.add_keyword_rule('Entertainment', ['netflix', 'spotify'])
+        self.categorizer.add_keyword_rule('Housing', 'rent', min_amount=500)
+        self.categorizer.add_regex_rule('Food', r'grocer(?:y|ies)')
+        self.categorizer.add_keyword_rule('Salary', 'payroll', trans_type='income')
+        self.categorizer.add_keyword_rule('Other', 'rent', name='fallback rent')
+
+    def test_categorize(self):
+        df = pd.DataFrame({
+            'description': ['AMZN Mktp US*123', 'NETFLIX.COM', 'Rent March', 'Tool rent',
+                            'Corner Grocery', 'ACME PAYROLL', 'ACME PAYROLL', 'Unknown shop'],
+            'amount': [30, 15, 1200, 40, 80, 3000, 50, 10],
+            'type': ['expense', 'expense', 'expense', 'expense', 'expense', 'income', 'expense', 'expense']
+        })
+        result = self.categorizer.categorize(df)
+        assert list(result) == ['Shopping', 'Entertainment', 'Housing', 'Other',
+                                'Food', 'Salary', None, None]
+
+    def test_rule_order_wins(self):
+        df = pd.DataFrame({'description': ['Netflix rent'], 'amount': [1000]})
+        assert list(self.categorizer.categorize(df)) == ['Entertainment']
+
+    def test_statistics(self):
+        df = pd.DataFrame({'description': ['Netflix', 'Spotify', 'Rent', 'nothing'],
+                           'amount': [15, 10, 100, 1]})
+        self.categorizer.categorize(df)
+        stats = self.categorizer.get_statistics()
+        assert stats['rule_hits']['keyword:netflix|spotify'] == 2
+        assert stats['rule_hits']['fallback rent'] == 1
+        assert stats['unmatched'] == 1
+
+    def test_import_from_csv(self, tmp_path):
+        filename = tmp_path / 'bank.csv'
+        pd.DataFrame({
+            'date': ['2024-03-01', '2024-03-02'],
+            'type': ['expense', 'expense'],
+            'description': ['AMAZON.COM order', 'Spotify'],
+            'amount': [25.0, 10.0],
+            'payment_method': ['Credit Card', 'Credit Card']
+        }).to_csv(filename, index=False)
+
+        tracker = PersonalFinanceTracker()
+        import_from_csv(tracker, filename, categorizer=self.categorizer)
+        assert list(tracker.transactions['category']) == ['Shopping', 'Entertainment']
+
+    def test_overlapping_and_boundaries(self):
+        categorizer = TransactionCategorizer()
+        categorizer.add_keyword_rule('Housing', 'rent march')
+        categorizer.add_merchant('X rent', [], 'Shopping')
+        categorizer.add_keyword_rule('Travel', 'air.com')
+        categorizer.add_regex_rule('Fees', r'FEE\s+\d+')
+        df = pd.DataFrame({'description': ['X RENT MARCH', 'currently', 'fair.com', 'air.com!', 'Bank fee 12'],
+                           'amount': [1, 1, 1, 1, 1]})
+        # The lower-index keyword overlaps the merchant match that starts earlier, yet still wins
+        assert list(categorizer.categorize(df)) == ['Housing', None, None, 'Travel', 'Fees']
+
+    def test_matches_rule_by_rule_on_unique_descriptions(self):
+        # Realistic bank strings carry a unique reference, so nothing is deduplicated away
+        rng = random.Random(0)
+        words = [''.join(rng.choice('abcdefghij') for _ in range(rng.randint(3, 6))) for _ in range(300)]
+        categorizer = TransactionCategorizer()
+        for index in range(150):
+            if index % 3 == 0:
+                categorizer.add_keyword_rule(f'C{index}', [words[index], words[index + 150]], name=f'k{index}')
+            elif index % 3 == 1:
+                categorizer.add_merchant(words[index].upper(), [words[index + 150] + ' MKTP'], f'C{index}')
+            else:
+                categorizer.add_regex_rule(f'C{index}', words[index] + r'\s*#?\d+', name=f'r{index}')
+
+        descriptions = [f"POS {rng.randint(10 ** 8, 10 ** 9)} {rng.choice(words).upper()} "
+                        f"{rng.choice(words)}{rng.choice(['', ' ', ' #'])}{rng.randint(1, 99)} MKTP"
+                        for _ in range(3000)]
+        result = categorizer.categorize(pd.DataFrame({'description': descriptions, 'amount': 1.0}))
+
+        def first_rule(description):
+            for rule in categorizer.rules:
+                if re.search(rule.pattern, description, re.IGNORECASE | re.DOTALL):
+                    return rule.category
+            return None
+        assert list(result) == [first_rule(description) for description in descriptions]
+        assert result.notna().sum() > 1000
+
+    def test_patterns_that_cannot_be_folded(self):
+        categorizer = TransactionCategorizer()
+        categorizer.add_regex_rule('Transfer', r'(?P<kind>SEPA|WIRE) TRANSFER')
+        categorizer.add_regex_rule('Refund', r'(?i)refund')
+        categorizer.add_regex_rule('Codes', r'^[A-Z]{3}-\d+$')
+        categorizer.add_regex_rule('Repeats', r'(\w)\1{2}')
+        categorizer.add_regex_rule('Cafe', r'CAF\xC9')
+        categorizer.add_regex_rule('Fuel', r'FUEL\s+\d+')
+        categorizer.add_keyword_rule('Food', ['lunch'])
+
+        descriptions = ['wire transfer 12', 'REFUND lunch', 'abc-123', 'zzz cafe', 'Café lunch',
+                        'Fuel 42', 'lunch [A-z]', 'nothing']
+        result = categorizer.categorize(pd.DataFrame({'description': descriptions, 'amount': 1.0}))
+        assert list(result) == ['Transfer', 'Refund', 'Codes', 'Repeats', 'Cafe', 'Fuel', 'Food', None]
+
+        with pytest.raises(re.error):
+            categorizer.add_regex_rule('Broken', r'(?P<kind>unclosed')
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,86 @@
+import json
+import os
+import subprocess
+import sys
+
+import pandas as pd
+from src import cli
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+def write_inputs(directory):
+    dates = pd.date_range('2024-01-01', '2024-03-31', freq='D')
+    transactions = pd.DataFrame({
+        'date': dates,
+        'type': ['income' if date.day == 1 else 'expense' for date in dates],
+        'category': ['Salary' if date.day == 1 else 'Food' for date in dates],
+        'description': [f'Entry {i}' for i in range(len(dates))],
+        'amount': [1000.0 if date.day == 1 else 10.0 for date in dates]
+    })
+    paths = []
+    for part in range(3):
+        path = os.path.join(directory, f'part{part}.csv')
+        transactions.iloc[part::3].to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+class TestCLI:
+    def test_import_then_report(self, tmp_path, capsys):
+        paths = write_inputs(str(tmp_path))
+        ledger = str(tmp_path / 'ledger')
+        assert cli.main(['import', '--ledger', ledger, '--jobs', '3', '--format', 'json', *paths]) == 0
+        records = json.loads(capsys.readouterr().out)
+        assert [record['added'] for record in records] == [31, 30, 30]
+
+        # Importing the same files again adds nothing
+        assert cli.main(['import', '--ledger', ledger, '--format', 'jsonl', paths[0]]) == 0
+        assert json.loads(capsys.readouterr().out)['added'] == 0
+
+        assert cli.main(['report', '--ledger', ledger, '--month', '2', '--year', '2024', '--format', 'json']) == 0
+        summary = json.loads(capsys.readouterr().out)[0]
+        assert summary['total_income'] == 1000
+        assert summary['total_expenses'] == 280
+        assert summary['transaction_count'] == 29
+
+    def test_alerts_exit_code(self, tmp_path, capsys):
+        paths = write_inputs(str(tmp_path))
+        argv = ['alerts', '-i', paths[0], '-i', paths[1], '-i', paths[2], '--month', '3', '--year', '2024',
+                '--budget', 'Food=250', '--budget', 'Salary=5000']
+        assert cli.main(argv) == 0
+        output = capsys.readouterr().out.splitlines()
+        assert output[0].startswith('category,budget_limit,amount_spent')
+        assert output[1].startswith('Food,250.0,300.0')
+        assert cli.main(argv + ['--fail-on-alert']) == cli.ALERTS_EXIT_CODE
+
+    def test_export_streams_partitions(self, tmp_path, capsys):
+        paths = write_inputs(str(tmp_path))
+        ledger = str(tmp_path / 'ledger')
+        cli.main(['import', '--ledger', ledger, *paths])
+        capsys.readouterr()
+
+        output = str(tmp_path / 'export.jsonl')
+        assert cli.main(['export', '--ledger', ledger, '--start', '2024-02-01', '--format', 'jsonl',
+                         '-o', output]) == 0
+        with open(output) as export_file:
+            rows = [json.loads(line) for line in export_file]
+        assert len(rows) == 60
+        assert min(row['date'] for row in rows).startswith('2024-02-01')
+
+    def test_chart_and_errors(self, tmp_path, capsys):
+        paths = write_inputs(str(tmp_path))
+        assert cli.main(['chart', 'spending-trends', '-i', paths[0], '--output-dir', str(tmp_path)]) == 0
+        with open(tmp_path / 'spending-trends.png', 'rb') as chart_file:
+            assert chart_file.read(8) == b'\x89PNG\r\n\x1a\n'
+
+        assert cli.main(['chart', 'pie-in-the-sky', '-i', paths[0]]) == 1
+        assert 'Unknown chart' in capsys.readouterr().err
+
+    def test_report_does_not_import_matplotlib(self, tmp_path):
+        paths = write_inputs(str(tmp_path))
+        script = ("import sys, cli; code = cli.main(sys.argv[1:]); "
+                  "sys.stderr.write(str('matplotlib' in sys.modules)); sys.exit(code)")
+        result = subprocess.run([sys.executable, '-c', script, 'report', '-i', paths[0], '--month', '1',
+                                 '--year', '2024'], cwd=SRC_DIR, capture_output=True, text=True)
+        assert result.returncode == 0
+        assert result.stdout.startswith('start,end,total_income')
+        assert result.stderr.endswith('False')
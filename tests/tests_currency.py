@@ -0,0 +1,92 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+import pytest
+from src.currency import FXRates, format_amount
+from src.finance_tracker import PersonalFinanceTracker
+from src.visualizer import FinanceVisualizer
+
+class TestCurrency:
+    def setup_method(self):
+        self.tracker = PersonalFinanceTracker()
+        self.tracker.fx_rates.add_rates([
+            {'date': '2024-01-01', 'currency': 'EUR', 'rate': 1.10},
+            {'date': '2024-02-01', 'currency': 'EUR', 'rate': 1.20},
+            {'date': '2024-01-01', 'currency': 'GBP', 'rate': 1.25},
+        ])
+        self.tracker.add_transaction('2024-01-05', 'income', 'Salary', 'Salary', 3000)
+        self.tracker.add_transaction('2024-01-10', 'expense', 'Food', 'Groceries', 100, currency='EUR')
+        self.tracker.add_transaction('2024-02-10', 'expense', 'Food', 'Groceries', 100, currency='EUR')
+
+    def test_as_of_conversion(self):
+        rates = self.tracker.fx_rates
+        converted = rates.convert([100, 100, 100, 100], ['EUR', 'EUR', 'GBP', 'USD'],
+                                  ['2023-12-01', '2024-01-31', '2024-03-01', '2024-03-01'], 'EUR')
+        assert np.allclose(converted, [100, 100, 125 / 1.2, 100 / 1.2])
+
+    def test_unknown_currency(self):
+        with pytest.raises(ValueError):
+            FXRates().convert([1], ['JPY'], ['2024-01-01'], 'USD')
+
+    def test_summary_in_reporting_currency(self):
+        summary = self.tracker.get_financial_summary()
+        assert summary['total_expenses'] == pytest.approx(230)
+
+        self.tracker.set_reporting_currency('EUR')
+        summary = self.tracker.get_financial_summary()
+        assert summary['total_income'] == pytest.approx(3000 / 1.10)
+        assert summary['total_expenses'] == pytest.approx(200)
+
+    def test_budget_alerts_use_converted_amounts(self):
+        self.tracker.set_budget('Food', 115)
+        alerts = self.tracker.check_budget_alerts(2, 2024)
+        assert alerts[0]['amount_spent'] == pytest.approx(120)
+
+    def test_budgets_keep_their_currency(self):
+        self.tracker.set_budget('Food', 120)
+        self.tracker.set_reporting_currency('EUR')
+        assert self.tracker.budget_limits['Food'] == pytest.approx(100)
+        assert self.tracker.check_budget_alerts(2, 2024) == []
+
+        self.tracker.set_budget('Shopping', 50, currency='GBP')
+        self.tracker.set_reporting_currency('USD')
+        assert dict(self.tracker.budget_limits) == pytest.approx({'Food': 120, 'Shopping': 62.5})
+        with pytest.raises(ValueError):
+            self.tracker.set_budget('Travel', 100, currency='JPY')
+
+    def test_unknown_currencies_are_rejected_on_write(self):
+        with pytest.raises(ValueError, match='JPY'):
+            self.tracker.add_transaction('2024-02-12', 'expense', 'Food', 'Sushi', 900, currency='JPY')
+        with pytest.raises(ValueError, match='CHF, JPY'):
+            self.tracker.add_transactions([
+                {'date': '2024-02-12', 'type': 'expense', 'category': 'Food', 'description': 'Sushi',
+                 'amount': 900, 'currency': 'jpy'},
+                {'date': '2024-02-13', 'type': 'expense', 'category': 'Food', 'description': 'Fondue',
+                 'amount': 30, 'currency': 'CHF'},
+            ])
+        assert len(self.tracker.transactions) == 3
+        assert self.tracker.get_financial_summary()['total_expenses'] == pytest.approx(230)
+
+    def test_cache_invalidated_by_rate_change(self):
+        snapshot = self.tracker.snapshot()
+        assert snapshot.report_transactions is snapshot.report_transactions
+        self.tracker.fx_rates.add_rates([{'date': '2024-02-01', 'currency': 'EUR', 'rate': 1.5}])
+        assert snapshot.report_transactions['amount'].iloc[2] == pytest.approx(150)
+
+    def test_append_reuses_converted_rows(self):
+        converted = self.tracker.snapshot().report_transactions
+        self.tracker.add_transaction('2024-02-11', 'expense', 'Food', 'Snack', 10, currency='GBP')
+        updated = self.tracker.snapshot().report_transactions
+        assert updated['amount'].iloc[-1] == pytest.approx(12.5)
+        assert list(updated['amount'].iloc[:3]) == list(converted['amount'])
+
+    def test_formatting_and_charts(self):
+        assert format_amount(12.5, 'EUR') == '€12.50'
+        assert format_amount(7.25, 'CHF') == 'CHF 7.25'
+        self.tracker.set_reporting_currency('GBP')
+        fig = FinanceVisualizer.plot_income_vs_expenses(self.tracker, show=False)
+        assert fig.axes[0].get_ylabel() == 'Amount (£)'
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,54 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+import pytest
+from src.downsampling import aggregate_by_period, choose_granularity, downsample, lttb, minmax_downsample
+from src.finance_tracker import PersonalFinanceTracker
+from src.visualizer import FinanceVisualizer
+
+class TestDownsampling:
+    def test_choose_granularity(self):
+        assert choose_granularity('2024-01-01', '2024-12-31', 400) == 'M'
+        assert choose_granularity('1950-01-01', '2024-12-31', 400) == 'Q'
+        assert choose_granularity('2024-01-01', '2024-03-01', 400, finest='D') == 'D'
+
+    def test_aggregate_matches_periods(self):
+        dates = pd.Series(pd.to_datetime(['2024-01-01', '2024-01-07', '2024-01-08', '2024-02-29', '2024-04-01']))
+        for granularity in ['D', 'W', 'M', 'Q', 'Y']:
+            expected = pd.Series(1.0, index=dates.dt.to_period(granularity).values).groupby(level=0).sum()
+            result = aggregate_by_period(dates, np.ones(len(dates)), granularity)
+            assert list(result.index) == list(expected.index.to_timestamp())
+            assert list(result.values) == list(expected.values)
+
+    def test_downsamplers_keep_endpoints_and_spikes(self):
+        y = np.sin(np.linspace(0, 20, 10000))
+        y[5000] = 50
+        keep = lttb(np.arange(len(y)), y, 200)
+        assert len(keep) == 200 and keep[0] == 0 and keep[-1] == len(y) - 1 and 5000 in keep
+        assert np.all(np.diff(keep) > 0)
+        keep = minmax_downsample(y, 200)
+        assert len(keep) <= 200 and 5000 in keep
+
+    def test_downsample_series(self):
+        series = pd.Series(np.arange(1000.0), index=pd.date_range('2020-01-01', periods=1000))
+        assert len(downsample(series, 100)) == 100
+        assert len(downsample(series, 2000)) == 1000
+        with pytest.raises(ValueError):
+            downsample(series, 100, method='nope')
+
+    def test_charts_fit_width(self):
+        tracker = PersonalFinanceTracker()
+        dates = pd.date_range('2000-01-01', '2024-12-31', freq='D')
+        tracker.add_transactions(pd.DataFrame({'date': dates, 'type': 'expense', 'category': 'Food',
+                                               'description': 'Groceries', 'amount': 10.0}))
+
+        fig = FinanceVisualizer.plot_spending_trends(tracker, show=False, granularity='D', width_px=600)
+        assert len(fig.axes[0].lines[0].get_xdata()) == 200
+        fig = FinanceVisualizer.plot_spending_trends(tracker, show=False)
+        assert fig.axes[0].get_title() == 'Total Monthly Spending Trend'
+        fig = FinanceVisualizer.plot_income_vs_expenses(tracker, months=300, show=False, width_px=1200)
+        assert fig.axes[0].get_title() == 'Quarterly Income vs Expenses'
+
+if __name__ == '__main__':
+    pytest.main()
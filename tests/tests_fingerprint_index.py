@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+from src.finance_tracker import PersonalFinanceTracker
+from src.utils import import_from_csv
+
+class TestFingerprintIndex:
+    def setup_method(self):
+        self.tracker = PersonalFinanceTracker()
+        self.tracker.add_transaction('2024-01-05', 'expense', 'Housing', 'Rent', 1200, 'Bank Transfer')
+        self.tracker.add_transaction('2024-01-10', 'expense', 'Food', 'Corner  Grocery', 45.5, 'Debit Card')
+
+    def write_statement(self, path, rows):
+        pd.DataFrame(rows, columns=['date', 'type', 'category', 'description', 'amount', 'payment_method']) \
+            .to_csv(path, index=False)
+
+    def test_find_duplicates_normalizes(self):
+        candidates = pd.DataFrame({
+            'date': ['2024-01-10', '2024-01-10', '2024-01-11'],
+            'description': ['corner grocery ', 'Corner Grocery', 'Corner Grocery'],
+            'amount': [45.50, 45.51, 45.50],
+            'payment_method': ['debit card', 'Debit Card', 'Debit Card']
+        })
+        assert list(self.tracker.find_duplicates(candidates)) == [True, False, False]
+
+    def test_import_drops_overlap(self, tmp_path):
+        statement = tmp_path / 'statement.csv'
+        self.write_statement(statement, [
+            ('2024-01-10', 'expense', 'Food', 'Corner Grocery', 45.5, 'Debit Card'),
+            ('2024-01-12', 'expense', 'Food', 'Bakery', 8.0, 'Debit Card'),
+        ])
+        import_from_csv(self.tracker, statement)
+        import_from_csv(self.tracker, statement)
+        assert len(self.tracker.transactions) == 3
+        assert len(self.tracker.search_transactions('bakery')) == 1
+
+    def test_import_flags_duplicates(self, tmp_path):
+        statement = tmp_path / 'statement.csv'
+        self.write_statement(statement, [
+            ('2024-01-05', 'expense', 'Housing', 'Rent', 1200, 'Bank Transfer'),
+            ('2024-01-12', 'expense', 'Food', 'Bakery', 8.0, 'Debit Card'),
+        ])
+        import_from_csv(self.tracker, statement, duplicates='flag')
+        assert len(self.tracker.transactions) == 4
+        assert list(self.tracker.transactions['duplicate'].iloc[2:]) == [True, False]
+
+    def test_repeated_purchases_are_counted(self, tmp_path):
+        self.tracker.add_transaction('2024-01-01', 'expense', 'Food', 'Coffee', 3.5, 'Card')
+        statement = tmp_path / 'statement.csv'
+        self.write_statement(statement, [
+            ('2024-01-01', 'expense', 'Food', 'Coffee', 3.5, 'Card'),
+            ('2024-01-01', 'expense', 'Food', 'Coffee', 3.5, 'Card'),
+        ])
+        import_from_csv(self.tracker, statement)
+        assert len(self.tracker.search_transactions('coffee')) == 2
+
+        # Both copies are now known, whether indexed incrementally or rebuilt
+        import_from_csv(self.tracker, statement)
+        self.tracker.rebuild_fingerprint_index()
+        import_from_csv(self.tracker, statement)
+        assert len(self.tracker.search_transactions('coffee')) == 2
+        three = pd.DataFrame({'date': ['2024-01-01'] * 3, 'description': ['Coffee'] * 3,
+                              'amount': [3.5] * 3, 'payment_method': ['Card'] * 3})
+        assert list(self.tracker.find_duplicates(three)) == [True, True, False]
+
+    def test_rebuild_matches_incremental(self):
+        before = self.tracker.find_duplicates(self.tracker.transactions)
+        self.tracker.rebuild_fingerprint_index()
+        assert list(before) == list(self.tracker.find_duplicates(self.tracker.transactions)) == [True, True]
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,135 @@
+import json
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+import pandas as pd
+import pytest
+from src.finance_tracker import PersonalFinanceTracker
+from src.partitioned_ledger import MANIFEST_FILE, PartitionedLedger
+from src.visualizer import FinanceVisualizer
+
+def make_transactions():
+    dates = pd.date_range('2024-01-01', '2024-06-30', freq='D')
+    return pd.DataFrame({
+        'date': dates,
+        'type': ['income' if date.day == 1 else 'expense' for date in dates],
+        'category': ['Salary' if date.day == 1 else 'Food' for date in dates],
+        'description': [f'Entry {i}' for i in range(len(dates))],
+        'amount': [1000.0 if date.day == 1 else 10.0 for date in dates]
+    })
+
+class TestPartitionedLedger:
+    def setup_method(self):
+        self.tracker = PersonalFinanceTracker()
+        self.tracker.add_transactions(make_transactions())
+
+    def test_partitions_and_manifest(self, tmp_path):
+        self.tracker.attach_ledger(str(tmp_path))
+        with open(tmp_path / MANIFEST_FILE) as manifest_file:
+            manifest = json.load(manifest_file)
+        assert sorted(manifest['partitions']) == [f'2024-0{month}' for month in range(1, 7)]
+        assert manifest['partitions']['2024-02']['rows'] == 29
+        assert os.path.exists(tmp_path / '2024-03.csv')
+        assert len(self.tracker.transactions) == 182
+
+    def test_reports_read_only_overlapping_partitions(self, tmp_path, monkeypatch):
+        self.tracker.attach_ledger(str(tmp_path), warm_start=False)
+        loaded = []
+        original = PartitionedLedger.load_partition
+        monkeypatch.setattr(PartitionedLedger, 'load_partition',
+                            lambda ledger, key, rows: loaded.append(key) or original(ledger, key, rows))
+
+        summary = self.tracker.get_financial_summary('2024-03-01', '2024-03-31')
+        assert loaded == ['2024-03']
+        assert summary['total_income'] == 1000
+        assert summary['total_expenses'] == 300
+
+        self.tracker.set_budget('Food', 100)
+        loaded.clear()
+        alerts = self.tracker.check_budget_alerts(5, 2024)
+        assert alerts[0]['category'] == 'Food'
+        assert loaded == ['2024-05']
+
+    def test_append_touches_one_partition(self, tmp_path):
+        self.tracker.attach_ledger(str(tmp_path))
+        before = {name: os.path.getmtime(tmp_path / name) for name in os.listdir(tmp_path)}
+        self.tracker.add_transaction('2024-04-15', 'expense', 'Food', 'Late lunch', 12.5)
+
+        manifest = self.tracker.ledger.partitions()
+        assert manifest['2024-04']['rows'] == 31
+        assert self.tracker.snapshot().row_count == 183
+        for name in ['2024-01.csv', '2024-05.csv', '2024-06.csv']:
+            assert os.path.getmtime(tmp_path / name) == before[name]
+
+        # A fresh tracker picks the ledger up from disk and rebuilds its indexes lazily
+        reopened = PersonalFinanceTracker()
+        reopened.attach_ledger(str(tmp_path))
+        assert len(reopened.transactions) == 183
+        assert len(reopened.search_transactions('late lunch')) == 1
+        assert reopened.find_duplicates(reopened.transactions.tail(1)).all()
+
+    def test_search_after_append_reads_matching_partitions(self, tmp_path, monkeypatch):
+        self.tracker.attach_ledger(str(tmp_path))
+        loaded = []
+        original = PartitionedLedger.load_partition
+        monkeypatch.setattr(PartitionedLedger, 'load_partition',
+                            lambda ledger, key, rows: loaded.append(key) or original(ledger, key, rows))
+        monkeypatch.setattr(self.tracker.description_index, 'rebuild', lambda *args: 1 / 0)
+
+        # The new rows land mid-ledger; their postings are merged in by row id
+        self.tracker.add_transactions([
+            {'date': '2024-02-10', 'type': 'expense', 'category': 'Food', 'description': 'Late lunch', 'amount': 12.5},
+            {'date': '2024-05-03', 'type': 'expense', 'category': 'Food', 'description': 'Late dinner', 'amount': 30},
+        ])
+        results = self.tracker.search_transactions('late')
+        assert list(results['description']) == ['Late lunch', 'Late dinner']
+        assert sorted(loaded) == ['2024-02', '2024-05']
+
+        loaded.clear()
+        results = self.tracker.search_transactions('entry 3*', start_date='2024-01-20', end_date='2024-02-10')
+        assert list(results['description']) == ['Entry 30', 'Entry 31', 'Entry 32', 'Entry 33', 'Entry 34',
+                                                'Entry 35', 'Entry 36', 'Entry 37', 'Entry 38', 'Entry 39']
+        assert sorted(loaded) == ['2024-01', '2024-02']
+
+    def test_failed_append_leaves_ledger_unchanged(self, tmp_path, monkeypatch):
+        ledger = PartitionedLedger(str(tmp_path))
+        rows = lambda dates, descriptions: pd.DataFrame({
+            'date': pd.to_datetime(dates), 'type': 'expense', 'category': 'Food',
+            'description': descriptions, 'amount': 1.0})
+        ledger.append(rows(['2024-01-05', '2024-02-05'], ['a', 'b']))
+
+        original = pd.DataFrame.to_csv
+        def failing_to_csv(frame, path, *args, **kwargs):
+            if str(path).endswith('2024-02.csv'):
+                raise OSError("disk full")
+            return original(frame, path, *args, **kwargs)
+        monkeypatch.setattr(pd.DataFrame, 'to_csv', failing_to_csv)
+        with pytest.raises(OSError):
+            ledger.append(rows(['2024-01-06', '2024-02-06'], ['c', 'd']))
+        monkeypatch.undo()
+
+        assert ledger.row_count() == 2
+        row_ids = ledger.append(rows(['2024-01-07'], ['e']))
+        assert list(ledger.load()['description']) == ['a', 'e', 'b']
+        assert list(ledger.load_rows(row_ids)['description']) == ['e']
+        assert list(PartitionedLedger(str(tmp_path)).load()['description']) == ['a', 'e', 'b']
+
+    def test_new_columns_extend_the_schema(self, tmp_path):
+        ledger = PartitionedLedger(str(tmp_path))
+        ledger.append(make_transactions().head(3))
+        flagged = make_transactions().iloc[[1, 40]].assign(duplicate=True)
+        ledger.append(flagged)
+
+        reopened = PartitionedLedger(str(tmp_path))
+        assert reopened.manifest['columns'][-1] == 'duplicate'
+        loaded = reopened.load()
+        assert len(loaded) == 5
+        assert list(loaded['duplicate'].fillna(False)) == [False, False, False, True, True]
+        assert list(loaded['description']) == ['Entry 0', 'Entry 1', 'Entry 2', 'Entry 1', 'Entry 40']
+
+    def test_visualizer_on_ledger(self, tmp_path):
+        self.tracker.attach_ledger(str(tmp_path))
+        self.tracker.set_budget('Food', 200)
+        assert FinanceVisualizer.plot_income_vs_expenses(self.tracker, months=2, show=False) is not None
+        assert FinanceVisualizer.plot_budget_vs_actual(self.tracker, 3, 2024, show=False) is not None
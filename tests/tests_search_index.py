@@ -0,0 +1,44 @@
+import pytest
+from src.finance_tracker import PersonalFinanceTracker
+
+class TestSearchIndex:
+    def setup_method(self):
+        self.tracker = PersonalFinanceTracker()
+        self.tracker.add_transaction('2024-01-01', 'income', 'Salary', 'Monthly salary', 3000)
+        self.tracker.add_transaction('2024-01-03', 'expense', 'Entertainment', 'Netflix subscription', 15)
+        self.tracker.add_transaction('2024-01-05', 'expense', 'Housing', 'Rent January', 1200)
+        self.tracker.add_transaction('2024-02-05', 'expense', 'Housing', 'Rent February', 1200)
+        self.tracker.add_transaction('2024-02-03', 'expense', 'Entertainment', 'Netflix subscription', 15)
+
+    def test_single_term(self):
+        results = self.tracker.search_transactions('rent')
+        assert list(results['description']) == ['Rent January', 'Rent February']
+
+    def test_and_query(self):
+        results = self.tracker.search_transactions('rent february')
+        assert list(results['description']) == ['Rent February']
+
+    def test_or_query(self):
+        results = self.tracker.search_transactions('salary netflix', mode='or')
+        assert len(results) == 3
+
+    def test_prefix_query(self):
+        results = self.tracker.search_transactions('netfl*')
+        assert len(results) == 2
+        assert len(self.tracker.search_transactions('netfl')) == 0
+
+    def test_filters(self):
+        results = self.tracker.search_transactions('netflix', start_date='2024-02-01')
+        assert list(results['date'].dt.month) == [2]
+        results = self.tracker.search_transactions('rent salary', mode='or', trans_type='income')
+        assert list(results['category']) == ['Salary']
+
+    def test_rebuild_matches_incremental(self):
+        self.tracker.description_index.vocabulary()
+        incremental = {token: list(rows) for token, rows in self.tracker.description_index.postings.items()}
+        self.tracker.rebuild_description_index()
+        rebuilt = {token: list(rows) for token, rows in self.tracker.description_index.postings.items()}
+        assert incremental == rebuilt
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,100 @@
+import threading
+import pandas as pd
+import pytest
+from src.finance_tracker import PersonalFinanceTracker
+
+class TestSnapshots:
+    def setup_method(self):
+        self.tracker = PersonalFinanceTracker()
+
+    def test_snapshot_is_isolated_from_later_writes(self):
+        self.tracker.add_transaction('2024-01-01', 'income', 'Salary', 'Salary', 3000)
+        snapshot = self.tracker.snapshot()
+        self.tracker.add_transaction('2024-01-02', 'expense', 'Food', 'Groceries', 100)
+        self.tracker.set_budget('Food', 50)
+        assert len(snapshot.transactions) == 1
+        assert 'Food' not in snapshot.budget_limits
+        assert len(self.tracker.transactions) == 2
+        assert self.tracker.version == snapshot.version + 2
+
+    def test_batch_publishes_once(self):
+        version = self.tracker.version
+        with self.tracker.batch():
+            self.tracker.add_transaction('2024-01-01', 'income', 'Salary', 'Salary', 3000)
+            self.tracker.add_transaction('2024-01-02', 'expense', 'Food', 'Groceries', 100)
+            assert len(self.tracker.transactions) == 0
+        assert self.tracker.version == version + 1
+        assert len(self.tracker.transactions) == 2
+        assert len(self.tracker.search_transactions('groceries')) == 1
+
+    def test_replacing_transactions_resets_indexes(self, tmp_path):
+        self.tracker.add_transaction('2024-01-01', 'income', 'Salary', 'Salary', 3000)
+        self.tracker.add_transaction('2024-01-02', 'expense', 'Food', 'Groceries', 100)
+        original = self.tracker.transactions
+        self.tracker.transactions = original.iloc[[1]]
+        assert len(self.tracker.search_transactions('salary')) == 0
+        assert len(self.tracker.search_transactions('groceries')) == 1
+        assert list(self.tracker.find_duplicates(original)) == [False, True]
+
+        self.tracker.attach_ledger(str(tmp_path))
+        with pytest.raises(ValueError):
+            self.tracker.transactions = self.tracker.transactions.head(0)
+        assert self.tracker.snapshot().row_count == 1
+
+    def test_appends_after_replacing_transactions_stay_searchable(self):
+        # Shaped like frames saved before currencies existed: no currency or payment_method columns
+        self.tracker.transactions = pd.DataFrame({
+            'date': pd.to_datetime(['2024-01-01', '2024-01-02']), 'type': ['income', 'expense'],
+            'category': ['Salary', 'Entertainment'], 'description': ['Salary', 'Netflix'],
+            'amount': [3000.0, 15.0]})
+        self.tracker.add_transaction('2024-01-03', 'expense', 'Food', 'Groceries', 100)
+        assert list(self.tracker.search_transactions('netflix')['amount']) == [15.0]
+        assert list(self.tracker.search_transactions('groceries')['amount']) == [100.0]
+        assert self.tracker.get_financial_summary()['total_expenses'] == 115
+
+    def test_concurrent_readers_and_writers(self):
+        writers, readers, pairs_per_writer = 4, 6, 10
+        errors = []
+        done = threading.Event()
+
+        def write(writer_id):
+            try:
+                for i in range(pairs_per_writer):
+                    # Each batch keeps income == expenses, so any torn read shows up as a mismatch
+                    with self.tracker.batch():
+                        self.tracker.add_transaction('2024-01-15', 'income', 'Salary', f'Pay {writer_id}', 100)
+                        self.tracker.add_transaction('2024-01-15', 'expense', 'Food', f'Meal {writer_id}', 100)
+            except Exception as excep:
+                errors.append(excep)
+
+        def read():
+            last_version = -1
+            try:
+                while not done.is_set():
+                    snapshot = self.tracker.snapshot()
+                    assert snapshot.version >= last_version
+                    last_version = snapshot.version
+                    summary = snapshot.get_financial_summary()
+                    if summary:
+                        assert summary['total_income'] == summary['total_expenses']
+                        assert summary['transaction_count'] % 2 == 0
+                    self.tracker.search_transactions('meal*')
+            except Exception as excep:
+                errors.append(excep)
+
+        reader_threads = [threading.Thread(target=read) for _ in range(readers)]
+        writer_threads = [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+        for thread in reader_threads + writer_threads:
+            thread.start()
+        for thread in writer_threads:
+            thread.join()
+        done.set()
+        for thread in reader_threads:
+            thread.join()
+
+        assert errors == []
+        assert len(self.tracker.transactions) == writers * pairs_per_writer * 2
+        assert len(self.tracker.search_transactions('meal*')) == writers * pairs_per_writer
+
+if __name__ == '__main__':
+    pytest.main()
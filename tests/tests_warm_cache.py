@@ -0,0 +1,143 @@
+import os
+import pickle
+import threading
+
+import pandas as pd
+from src import finance_tracker
+from src.finance_tracker import PersonalFinanceTracker
+from src.partitioned_ledger import PartitionedLedger
+from src.utils import import_from_csv
+from src.warm_cache import CACHE_FILE, WarmCache, content_fingerprint
+
+def make_tracker():
+    tracker = PersonalFinanceTracker()
+    tracker.fx_rates.add_rates([{'date': '2024-01-01', 'currency': 'EUR', 'rate': 1.10},
+                                {'date': '2024-03-01', 'currency': 'EUR', 'rate': 1.20}])
+    dates = pd.date_range('2024-01-01', '2024-04-30', freq='D')
+    tracker.add_transactions(pd.DataFrame({
+        'date': dates,
+        'type': ['income' if date.day == 1 else 'expense' for date in dates],
+        'category': ['Salary' if date.day == 1 else ('Food' if date.day % 2 else 'Transportation')
+                     for date in dates],
+        'description': [f'Entry {i}' for i in range(len(dates))],
+        'amount': [2000.0 if date.day == 1 else float(date.day) for date in dates],
+        'currency': ['EUR' if date.day % 3 == 0 else 'USD' for date in dates]
+    }))
+    return tracker
+
+class TestWarmCache:
+    def test_warm_start_skips_rebuild(self, tmp_path, monkeypatch):
+        cold = make_tracker()
+        cold.attach_ledger(str(tmp_path))
+        assert (tmp_path / CACHE_FILE).exists()
+
+        monkeypatch.setattr(finance_tracker, 'build_derived', lambda *args: 1 / 0)
+        warm = PersonalFinanceTracker()
+        warm.fx_rates = cold.fx_rates
+        warm.attach_ledger(str(tmp_path))
+        assert warm.description_index.size == 121
+        assert warm.find_duplicates(cold.transactions.head(3)).all()
+        assert warm.snapshot().totals is not None
+
+    def test_totals_match_row_reports(self, tmp_path):
+        tracker = make_tracker()
+        expected = tracker.get_financial_summary('2024-02-01', '2024-03-15')
+        expected_analysis = tracker.get_category_analysis('2024-03-01', '2024-03-31')
+        tracker.set_budget('Food', 50)
+        expected_alerts = tracker.check_budget_alerts(3, 2024)
+
+        tracker.attach_ledger(str(tmp_path))
+        summary = tracker.get_financial_summary('2024-02-01', '2024-03-15')
+        assert summary.keys() == expected.keys()
+        for key in expected:
+            assert abs(summary[key] - expected[key]) < 1e-9
+        analysis = tracker.get_category_analysis('2024-03-01', '2024-03-31')
+        pd.testing.assert_series_equal(analysis['expense_by_category'], expected_analysis['expense_by_category'])
+        assert tracker.check_budget_alerts(3, 2024) == expected_alerts
+
+    def test_stale_cache_is_rebuilt(self, tmp_path):
+        tracker = make_tracker()
+        tracker.attach_ledger(str(tmp_path))
+        # Appended without save_warm_cache(), so the saved fingerprint no longer matches
+        tracker.add_transaction('2024-04-30', 'expense', 'Food', 'Late dinner', 40)
+
+        reopened = PersonalFinanceTracker()
+        reopened.fx_rates = tracker.fx_rates
+        reopened.attach_ledger(str(tmp_path))
+        assert reopened.get_financial_summary('2024-04-30', '2024-04-30')['transaction_count'] == 2
+        assert WarmCache(str(tmp_path)).load(content_fingerprint(reopened.ledger)) is not None
+
+    def test_same_size_edit_is_detected(self, tmp_path):
+        tracker = make_tracker()
+        tracker.attach_ledger(str(tmp_path))
+        path = tmp_path / '2024-02.csv'
+        stat = os.stat(path)
+        content = path.read_text()
+        assert ',Entry 31,' in content
+        path.write_text(content.replace(',Entry 31,', ',Entry zz,'))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert os.path.getsize(path) == stat.st_size
+
+        reopened = PersonalFinanceTracker()
+        reopened.fx_rates = tracker.fx_rates
+        reopened.attach_ledger(str(tmp_path))
+        assert len(reopened.search_transactions('zz')) == 1
+        assert len(reopened.search_transactions('entry 31')) == 0
+
+    def test_import_saves_without_loading_partitions(self, tmp_path, monkeypatch):
+        tracker = make_tracker()
+        tracker.attach_ledger(str(tmp_path / 'ledger'))
+        statement = tmp_path / 'statement.csv'
+        pd.DataFrame({'date': ['2024-02-03', '2024-04-20'], 'type': 'expense', 'category': 'Food',
+                      'description': ['Bakery', 'Market'], 'amount': [8.0, 30.0]}).to_csv(statement, index=False)
+
+        monkeypatch.setattr(PartitionedLedger, 'load_partition', lambda *args: 1 / 0)
+        import_from_csv(tracker, statement)
+        assert tracker.snapshot().row_count == 123
+        monkeypatch.undo()
+
+        reopened = PersonalFinanceTracker()
+        reopened.fx_rates = tracker.fx_rates
+        monkeypatch.setattr(finance_tracker, 'build_derived', lambda *args: 1 / 0)
+        reopened.attach_ledger(str(tmp_path / 'ledger'))
+        assert list(reopened.search_transactions('bakery OR market', mode='or')['amount']) == [8.0, 30.0]
+        assert reopened.find_duplicates(tracker.search_transactions('bakery')).all()
+
+    def test_concurrent_saves_never_publish_partial_files(self, tmp_path):
+        tracker = make_tracker()
+        tracker.attach_ledger(str(tmp_path))
+        cache = WarmCache(str(tmp_path))
+        fingerprint = content_fingerprint(tracker.ledger)
+        derived = cache.load(fingerprint)
+
+        errors = []
+        def save_repeatedly():
+            try:
+                for _ in range(20):
+                    cache.save(fingerprint, derived)
+            except Exception as excep:
+                errors.append(excep)
+        workers = [threading.Thread(target=save_repeatedly) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert errors == []
+        assert cache.load(fingerprint)['description_index']['size'] == 121
+        assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+    def test_schema_mismatch_is_ignored(self, tmp_path):
+        tracker = make_tracker()
+        tracker.attach_ledger(str(tmp_path))
+        cache = WarmCache(str(tmp_path))
+        fingerprint = content_fingerprint(tracker.ledger)
+        with open(cache.path, 'rb') as cache_file:
+            cached = pickle.load(cache_file)
+        cached['schema_version'] = -1
+        with open(cache.path, 'wb') as cache_file:
+            pickle.dump(cached, cache_file)
+        assert cache.load(fingerprint) is None
+
+        tracker.save_warm_cache()
+        assert cache.load(fingerprint) is not None